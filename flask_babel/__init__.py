@@ -8,23 +8,79 @@
     :license: BSD, see LICENSE for more details.
 """
 
+import hashlib
+import importlib
+import io
+import itertools
+import json
 import os
-from dataclasses import dataclass
-from types import SimpleNamespace
-from datetime import datetime
-from contextlib import contextmanager
-from typing import List, Callable, Optional, Union
-
-from babel.support import Translations, NullTranslations
-from flask import current_app, g
-from babel import dates, numbers, support, Locale
-from pytz import timezone, UTC
+import re
+import shutil
+import stat
+import sys
+import tempfile
+import threading
+import time
+import unicodedata
+import weakref
+from collections import ChainMap, Counter, OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import MappingProxyType, SimpleNamespace
+from datetime import datetime, tzinfo
+from contextlib import ExitStack, closing, contextmanager
+from functools import wraps
+from typing import Dict, Iterable, Iterator, List, Callable, Optional, Tuple, Union
+
+from flask import (
+    Blueprint,
+    abort,
+    current_app,
+    g,
+    has_app_context,
+    make_response,
+    render_template,
+    request,
+)
+from jinja2 import nodes
+from jinja2.ext import Extension
+from babel import localedata, Locale, UnknownLocaleError
 from werkzeug.datastructures import ImmutableDict
-from werkzeug.utils import cached_property
 
 from flask_babel.speaklater import LazyString
 
 
+class _LazyModule:
+    """Imports the module `name` when one of its attributes is first used,
+    and then replaces itself with the module in the globals of this module.
+    This keeps ``import flask_babel`` cheap for scripts and CLI commands
+    that never format a date or load a catalog.
+    """
+
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+
+_gettext = _LazyModule("gettext", "_gettext")
+dates = _LazyModule("babel.dates", "dates")
+numbers = _LazyModule("babel.numbers", "numbers")
+support = _LazyModule("babel.support", "support")
+pytz = _LazyModule("pytz", "pytz")
+
+
+def __getattr__(name):
+    # Formerly imported from babel.support.
+    if name in ("Translations", "NullTranslations"):
+        return getattr(support, name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 @dataclass
 class BabelConfiguration:
     """Application-specific configuration for Babel."""
@@ -40,6 +96,147 @@ class BabelConfiguration:
     locale_selector: Optional[Callable] = None
     timezone_selector: Optional[Callable] = None
 
+    compact_catalogs: bool = False
+    background_loading: bool = False
+    format_cache: Optional["_LRUCache"] = None
+    hot_set: Optional["_HotSet"] = None
+    cache_store: Optional["MemoryCacheStore"] = None
+    domain_instance: Optional["Domain"] = None
+
+
+@dataclass
+class CatalogLoadTime:
+    """The time it took to load one catalog, as reported by
+    :meth:`Babel.preload_translations`.
+    """
+
+    locale: str
+    domain: str
+    seconds: float
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_missing = object()
+
+
+class _LRUCache:
+    """A thread-safe mapping holding at most `maxsize` items, discarding
+    the least recently used ones first.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+class _HotSet:
+    """Counts how often each catalog is served and saves the counts to
+    `path` at most every `interval` seconds.  Counts saved by previous runs
+    are loaded from `path` and added to.  Failing to load or save the
+    counts is logged to `logger` and never breaks starting the application
+    or translating.
+    """
+
+    def __init__(self, path, interval, logger):
+        self.path = path
+        self.interval = interval
+        self.logger = logger
+        self.counts = Counter()
+        self._saved_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                for locale, domain, count in json.load(f):
+                    self.counts[locale, domain] = count
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError):
+            self.counts.clear()
+            self.logger.exception("Failed to load the hot set from %s", path)
+
+    def record(self, locale, domain):
+        with self._lock:
+            self.counts[locale, domain] += 1
+            due = time.monotonic() - self._saved_at >= self.interval
+
+        if due:
+            try:
+                self.save()
+            except OSError:
+                self.logger.exception("Failed to save the hot set to %s", self.path)
+
+    def save(self):
+        with self._lock:
+            self._saved_at = time.monotonic()
+            data = [[*key, count] for key, count in self.counts.most_common()]
+        _write_atomic(self.path, json.dumps(data).encode("utf-8"))
+
+
+class MemoryCacheStore:
+    """A bounded in-memory store for :class:`FragmentCacheExtension` and
+    :func:`cached_view`, dropping the least recently used items when it
+    holds more than `maxsize` of them.  Any object with the same `get` and
+    `set` methods can be passed to :meth:`Babel.init_app` instead, such as
+    a Flask-Caching cache.
+
+    .. versionadded:: 4.1
+    """
+
+    def __init__(self, maxsize=1024, default_timeout=300):
+        self.default_timeout = default_timeout
+        self._cache = _LRUCache(maxsize)
+
+    def get(self, key):
+        """Returns the value stored for `key`, or `None`."""
+        item = self._cache.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires is not None and expires < time.monotonic():
+            return None
+        return value
+
+    def set(self, key, value, timeout=None):
+        """Stores `value` for `timeout` seconds, or forever if `timeout`
+        is ``0``.
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+        expires = time.monotonic() + timeout if timeout else None
+        self._cache.set(key, (expires, value))
+
 
 def get_babel(app=None) -> "BabelConfiguration":
     app = app or current_app
@@ -99,6 +296,12 @@ class Babel:
         default_timezone="UTC",
         locale_selector=None,
         timezone_selector=None,
+        compact_catalogs=False,
+        background_loading=False,
+        format_cache_size=0,
+        hot_set_file=None,
+        preload_locale_data=False,
+        cache_store=None,
     ):
         """
         Initializes the Babel instance for use with this specific application.
@@ -115,6 +318,26 @@ class Babel:
                                 for a request
         :param timezone_selector: The function to use to select the
                                   timezone for a request
+        :param compact_catalogs: Intern the message ids and strings of
+                                 loaded catalogs so they are shared between
+                                 locales and domains.
+        :param background_loading: Load missing catalogs in a background
+                                   thread, serving the default locale until
+                                   they are ready instead of blocking the
+                                   request.
+        :param format_cache_size: The number of formatted values to remember
+                                  per application.  Set to ``0`` to disable
+                                  the cache.
+        :param hot_set_file: A file to periodically save the locales and
+                             domains served by this application to.  The
+                             catalogs listed in it are loaded, most used
+                             first, when the application is initialized.
+        :param preload_locale_data: Load the CLDR data of every locale with
+                                    translations right away, rather than
+                                    when it is first used for formatting.
+        :param cache_store: The store used by :class:`FragmentCacheExtension`
+                            and :func:`cached_view`.  Defaults to a
+                            :class:`MemoryCacheStore`.
         """
         if not hasattr(app, "extensions"):
             app.extensions = {}
@@ -123,6 +346,9 @@ class Babel:
             "BABEL_TRANSLATION_DIRECTORIES", default_translation_directories
         ).split(";")
 
+        format_cache_size = app.config.get("BABEL_FORMAT_CACHE_SIZE", format_cache_size)
+        hot_set_file = app.config.get("BABEL_HOT_SET_FILE", hot_set_file)
+
         app.extensions["babel"] = BabelConfiguration(
             default_locale=app.config.get("BABEL_DEFAULT_LOCALE", default_locale),
             default_timezone=app.config.get("BABEL_DEFAULT_TIMEZONE", default_timezone),
@@ -132,8 +358,30 @@ class Babel:
             instance=self,
             locale_selector=locale_selector,
             timezone_selector=timezone_selector,
+            compact_catalogs=app.config.get("BABEL_COMPACT_CATALOGS", compact_catalogs),
+            background_loading=app.config.get(
+                "BABEL_BACKGROUND_LOADING", background_loading
+            ),
+            format_cache=_LRUCache(format_cache_size) if format_cache_size else None,
+            hot_set=(
+                _HotSet(
+                    hot_set_file,
+                    app.config.get("BABEL_HOT_SET_INTERVAL", 300),
+                    app.logger,
+                )
+                if hot_set_file
+                else None
+            ),
+            cache_store=cache_store if cache_store is not None else MemoryCacheStore(),
+        )
+        app.extensions["babel"].domain_instance = Domain(
+            domain=app.extensions["babel"].default_domain
         )
 
+        from flask_babel.cli import babel_cli
+
+        app.cli.add_command(babel_cli)
+
         # a mapping of Babel datetime format strings that can be modified
         # to change the defaults.  If you invoke :func:`format_datetime`
         # and do not provide any format string Flask-Babel will do the
@@ -160,6 +408,11 @@ class Babel:
                 percentformat=format_percent,
                 scientificformat=format_scientific,
             )
+            app.jinja_env.globals.update(
+                timezone_names=get_timezone_names,
+                territory_names=get_territory_names,
+                language_names=get_language_names,
+            )
             app.jinja_env.add_extension("jinja2.ext.i18n")
             app.jinja_env.install_gettext_callables(
                 gettext=lambda s: get_translations().ugettext(s),
@@ -169,6 +422,14 @@ class Babel:
                 npgettext=lambda c, s, p, n: get_translations().unpgettext(c, s, p, n),
             )
 
+        if hot_set_file:
+            with app.app_context():
+                self.prewarm_hot_set()
+
+        if app.config.get("BABEL_PRELOAD_LOCALE_DATA", preload_locale_data):
+            with app.app_context():
+                self.preload_locale_data()
+
     def list_translations(self):
         """Returns a list of all the locales translations exist for. The list
         returned will be filled with actual locale objects and not just strings.
@@ -198,6 +459,172 @@ class Babel:
             result.append(self.default_locale)
         return result
 
+    def preload_translations(
+        self, domains=None, max_workers=None, use_processes=False
+    ) -> List[CatalogLoadTime]:
+        """Loads the catalogs of every locale returned by
+        :meth:`list_translations` concurrently and stores them in the cache
+        of each domain, so no request has to wait for them.  Must be called
+        within an application context, typically right after :meth:`init_app`::
+
+            with app.app_context():
+                babel.preload_translations()
+
+        :param domains: The :class:`Domain` instances to preload.  Defaults
+                        to the application's default domain.
+        :param max_workers: The maximum number of catalogs loaded at once.
+        :param use_processes: Parse the catalog files in a pool of processes
+                              rather than threads.  Only applies to plain
+                              :class:`Domain` instances without a source.
+        :return: How long each catalog took to load.
+
+        .. versionadded:: 4.1
+        """
+        if domains is None:
+            domains = [self.domain_instance]
+        locales = list(
+            {str(locale): locale for locale in self.list_translations()}.values()
+        )
+
+        app = current_app._get_current_object()
+        ctx = _get_current_context()
+
+        def load(domain, locale):
+            with app.app_context():
+                start = time.perf_counter()
+                translations = domain._prepare_translations(locale)
+                return translations, time.perf_counter() - start
+
+        with ExitStack() as stack:
+            threads = stack.enter_context(ThreadPoolExecutor(max_workers))
+            if use_processes:
+                from concurrent.futures import ProcessPoolExecutor
+
+                processes = stack.enter_context(ProcessPoolExecutor(max_workers))
+
+            jobs = []
+            for domain in domains:
+                for locale in locales:
+                    in_process = (
+                        use_processes
+                        and type(domain) is Domain
+                        and domain.source is None
+                    )
+                    if in_process:
+                        future = processes.submit(
+                            _load_catalog_data,
+                            domain.translation_directories,
+                            domain.domain,
+                            locale,
+                        )
+                    else:
+                        future = threads.submit(load, domain, locale)
+                    jobs.append((domain, locale, in_process, future))
+
+            result = []
+            for domain, locale, in_process, future in jobs:
+                translations, seconds = future.result()
+                if in_process:
+                    translations = domain._share_translations(
+                        _build_translations(*translations)
+                    )
+                cache = domain.get_translations_cache(ctx)
+                cache[str(locale), domain.domain[0]] = translations
+                result.append(CatalogLoadTime(str(locale), domain.domain[0], seconds))
+
+        return result
+
+    def preload_locale_data(self):
+        """Loads the CLDR data of the locales returned by
+        :meth:`list_translations`, which Babel otherwise reads from disk the
+        first time a value is formatted for a locale.  The data is cached
+        for the whole process, so doing this before the server forks worker
+        processes shares it between them.
+
+        .. versionadded:: 4.1
+        """
+        for locale in self.list_translations():
+            localedata.load(str(locale))
+        # Also load the timezone, which pytz reads lazily as well.
+        self.default_timezone
+
+    def prewarm_hot_set(self, domains=None):
+        """Loads the catalogs recorded in the hot set file of the current
+        application, most frequently served first.  This happens for the
+        default domain when the application is initialized; call it again
+        with any additional :class:`Domain` instances used by the
+        application.
+
+        .. versionadded:: 4.1
+        """
+        hot_set = get_babel().hot_set
+        if hot_set is None:
+            return
+
+        domains = {d.domain[0]: d for d in domains or [self.domain_instance]}
+        for (locale, name), _ in hot_set.counts.most_common():
+            if name not in domains:
+                continue
+            try:
+                domains[name].get_locale_translations(Locale.parse(locale))
+            except (UnknownLocaleError, ValueError):
+                current_app.logger.exception(
+                    "Failed to prewarm the catalog of %s from the hot set", locale
+                )
+
+    def save_hot_set(self):
+        """Saves the hot set of the current application right away, for
+        example when shutting down.
+
+        .. versionadded:: 4.1
+        """
+        hot_set = get_babel().hot_set
+        if hot_set is not None:
+            hot_set.save()
+
+    def format_cache_info(self) -> Optional["CacheInfo"]:
+        """Returns the statistics of the format cache of the current
+        application, or `None` if it is disabled.
+
+        .. versionadded:: 4.1
+        """
+        cache = get_babel().format_cache
+        return cache.info() if cache is not None else None
+
+    def clear_format_cache(self):
+        """Empties the format cache of the current application.  This is
+        required after changing :attr:`date_formats` while it is enabled.
+
+        .. versionadded:: 4.1
+        """
+        cache = get_babel().format_cache
+        if cache is not None:
+            cache.clear()
+
+    def translator(self, locale, timezone=None, domain=None) -> "Translator":
+        """Returns a :class:`Translator` for `locale`, which translates and
+        formats without needing a request or application context afterwards.
+        Must be called within an application context.
+
+        :param locale: The locale to translate to (ex: 'de_DE').
+        :param timezone: The timezone name or `tzinfo` to format dates in.
+                         Defaults to the default timezone.
+        :param domain: The :class:`Domain` to translate with.  Defaults to
+                       the current domain.
+
+        .. versionadded:: 4.1
+        """
+        locale = Locale.parse(locale)
+        domain = domain or get_domain()
+        return Translator(
+            locale=locale,
+            tzinfo=(
+                self.default_timezone if timezone is None else _parse_timezone(timezone)
+            ),
+            translations=domain.get_locale_translations(locale),
+            date_formats=ImmutableDict(self.date_formats),
+        )
+
     @property
     def default_locale(self) -> Locale:
         """The default locale from the configuration as an instance of a
@@ -206,21 +633,21 @@ class Babel:
         return Locale.parse(get_babel().default_locale)
 
     @property
-    def default_timezone(self) -> timezone:
+    def default_timezone(self) -> tzinfo:
         """The default timezone from the configuration as an instance of a
         `pytz.timezone` object.
         """
-        return timezone(get_babel().default_timezone)
+        return pytz.timezone(get_babel().default_timezone)
 
     @property
     def domain(self) -> str:
         """The message domain for the translations as a string."""
         return get_babel().default_domain
 
-    @cached_property
+    @property
     def domain_instance(self):
         """The message domain for the translations."""
-        return Domain(domain=self.domain)
+        return get_babel().domain_instance
 
     @staticmethod
     def _resolve_directories(directories: List[str], app=None):
@@ -233,7 +660,7 @@ class Babel:
                 yield os.path.join(app.root_path, path)
 
 
-def get_translations() -> Union[Translations, NullTranslations]:
+def get_translations() -> Union["support.Translations", "support.NullTranslations"]:
     """Returns the correct gettext translations that should be used for
     this request.  This will never fail and return a dummy translation
     object if used outside the request or if a translation cannot be found.
@@ -265,7 +692,7 @@ def get_locale() -> Optional[Locale]:
     return locale
 
 
-def get_timezone() -> Optional[timezone]:
+def get_timezone() -> Optional[tzinfo]:
     """Returns the timezone that should be used for this request as
     a `pytz.timezone` object.  This returns `None` if used outside a request.
     """
@@ -280,11 +707,18 @@ def get_timezone() -> Optional[timezone]:
             if rv is None:
                 tzinfo = babel.instance.default_timezone
             else:
-                tzinfo = timezone(rv) if isinstance(rv, str) else rv
+                tzinfo = _parse_timezone(rv)
         ctx.babel_tzinfo = tzinfo
     return tzinfo
 
 
+def _parse_timezone(value):
+    """Returns the timezone for `value`, which can be a timezone name or
+    a `tzinfo` object.
+    """
+    return pytz.timezone(value) if isinstance(value, str) else value
+
+
 def refresh():
     """Refreshes the cached timezones and locale information.  This can
     be used to switch a translation between a request and if you want
@@ -343,15 +777,480 @@ def force_locale(locale):
             setattr(ctx, key, value)
 
 
-def _get_format(key, format) -> Optional[str]:
+@dataclass(frozen=True)
+class ContextSnapshot:
+    """The locale, timezone and domain of a request, as captured by
+    :func:`capture_context`.  Snapshots can be pickled, or converted to a
+    dictionary with :func:`dataclasses.asdict` and back, to pass them to
+    task queues.
+
+    `plain_domain` is false when the domain is a :class:`CompositeDomain`,
+    an :class:`OverlayDomain` or has a source, which can not be created
+    again from its name alone.  `token` identifies the domain object in the
+    process which captured the snapshot.
+
+    .. versionadded:: 4.1
+    """
+
+    locale: str
+    timezone: str
+    domain: str
+    translation_directories: Optional[Tuple[str, ...]] = None
+    plain_domain: bool = True
+    token: str = field(default_factory=lambda: os.urandom(16).hex(), compare=False)
+
+
+# Domains of captured snapshots by their token, so restoring a snapshot in
+# the same process uses the very same domain and its cached catalogs.
+# Snapshots of different domains can be equal, such as the ones of several
+# overlays over the same base domain, so they are not used as keys.  Every
+# domain gets a single token, however many snapshots are captured.
+_captured_domains = weakref.WeakValueDictionary()
+_domain_tokens = weakref.WeakKeyDictionary()
+
+# Domains created to restore snapshots captured in another process.
+_restored_domains = {}
+
+
+def _get_timezone_name(tzinfo) -> str:
+    return getattr(tzinfo, "zone", None) or getattr(tzinfo, "key", None) or str(tzinfo)
+
+
+def capture_context() -> ContextSnapshot:
+    """Returns a snapshot of the locale, timezone and domain of the current
+    request, which can be restored with :func:`restore_context` in another
+    thread or process::
+
+        snapshot = capture_context()
+        send_email.delay(user.id, snapshot)
+
+        @task
+        def send_email(user_id, snapshot):
+            with app.app_context(), restore_context(snapshot):
+                ...
+
+    The locale and timezone selectors are run if they were not already for
+    this request.
+
+    .. versionadded:: 4.1
+    """
+    domain = get_domain()
+    token = _domain_tokens.get(domain)
+    if token is None:
+        token = _domain_tokens.setdefault(domain, os.urandom(16).hex())
+        _captured_domains[token] = domain
+
+    directories = domain._translation_directories
+    return ContextSnapshot(
+        locale=str(get_locale()),
+        timezone=_get_timezone_name(get_timezone()),
+        domain=";".join(domain.domain),
+        translation_directories=tuple(directories) if directories else None,
+        plain_domain=type(domain) is Domain and domain.source is None,
+        token=token,
+    )
+
+
+def _get_snapshot_domain(snapshot):
+    domain = _captured_domains.get(snapshot.token)
+    if domain is not None:
+        return domain
+
+    if not snapshot.plain_domain:
+        raise RuntimeError(
+            "The domain {!r} of the snapshot can not be created again in "
+            "another process, pass it to restore_context()".format(snapshot.domain)
+        )
+
+    default = get_babel().domain_instance
+    if snapshot.translation_directories is None and snapshot.domain == ";".join(
+        default.domain
+    ):
+        return default
+
+    key = snapshot.translation_directories, snapshot.domain
+    domain = _restored_domains.get(key)
+    if domain is None:
+        domain = _restored_domains.setdefault(
+            key,
+            Domain(snapshot.translation_directories, snapshot.domain),
+        )
+    return domain
+
+
+@contextmanager
+def restore_context(snapshot: ContextSnapshot, domain: Optional["Domain"] = None):
+    """Temporarily uses the locale, timezone and domain of `snapshot`, as
+    returned by :func:`capture_context`, without running the locale and
+    timezone selectors.  Must be used within an application context.
+    Catalogs are served from the cache of the domain, which is the same
+    domain object when the snapshot was captured in the same process.
+
+    In other processes, plain :class:`Domain` instances are created again
+    from their name and translation directories.  Other domains must be
+    passed as `domain`, or a :exc:`RuntimeError` is raised.
+
+    .. versionadded:: 4.1
+    """
+    ctx = _get_current_context()
+    if ctx is None:
+        raise RuntimeError("restore_context() needs an application context")
+
+    orig_attrs = {}
+    for key in (
+        "babel_locale",
+        "babel_tzinfo",
+        "babel_domain",
+        "babel_translations",
+        "forced_babel_locale",
+    ):
+        orig_attrs[key] = getattr(ctx, key, _missing)
+
+    try:
+        ctx.babel_locale = Locale.parse(snapshot.locale)
+        ctx.forced_babel_locale = ctx.babel_locale
+        ctx.babel_tzinfo = _parse_timezone(snapshot.timezone)
+        ctx.babel_domain = (
+            domain if domain is not None else _get_snapshot_domain(snapshot)
+        )
+        ctx.babel_translations = None
+        yield
+    finally:
+        for key, value in orig_attrs.items():
+            if value is _missing:
+                ctx.__dict__.pop(key, None)
+            else:
+                setattr(ctx, key, value)
+
+
+def _format_cache_key(value):
+    """Returns the part of a format cache key for `value`.  Values that
+    compare equal can still format differently, such as ``1`` and ``True``,
+    ``0.0`` and ``-0.0``, ``Decimal("1.0")`` and ``Decimal("1.00")``, or
+    datetimes in other timezones.
+    """
+    decimal = sys.modules.get("decimal")
+    if isinstance(value, float) or (
+        decimal is not None and isinstance(value, decimal.Decimal)
+    ):
+        return type(value), repr(value)
+    return type(value), value, getattr(value, "tzinfo", None)
+
+
+def _memoized(uses_timezone=False):
+    """Caches the results of a formatting function in the format cache of
+    the current application, if it is enabled.  Calls without a value to
+    format (which format the current time) are never cached.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            ctx = _get_current_context()
+            cache = get_babel().format_cache if ctx is not None else None
+            if cache is None or not args or args[0] is None:
+                return func(*args, **kwargs)
+
+            key = (
+                func.__name__,
+                str(get_locale()),
+                str(get_timezone()) if uses_timezone else None,
+                tuple(_format_cache_key(arg) for arg in args),
+                tuple(sorted(kwargs.items())),
+            )
+            try:
+                rv = cache.get(key, _missing)
+            except TypeError:
+                return func(*args, **kwargs)
+            if rv is _missing:
+                rv = func(*args, **kwargs)
+                cache.set(key, rv)
+            return rv
+
+        return wrapper
+
+    return decorator
+
+
+def render_templates_bulk(
+    template_name_or_list, contexts: Iterable[Dict], max_workers=None, chunk_size=100
+) -> Iterator[str]:
+    """Renders a template once for every context in `contexts`, each in
+    the locale given by its ``locale`` key and the timezone given by its
+    optional ``timezone`` key.  Must be called within an application
+    context::
+
+        contexts = [
+            {"locale": user.locale, "timezone": user.timezone, "user": user}
+            for user in users
+        ]
+        for user, body in zip(users, render_templates_bulk("email.txt", contexts)):
+            send_email(user, body)
+
+    Contexts sharing a locale and timezone are rendered together in chunks
+    of up to `chunk_size`, so the locale is resolved once per chunk rather
+    than once per context, and the chunks are rendered on a pool of
+    `max_workers` threads.  The rendered templates are yielded in the order
+    of `contexts` as soon as they are ready.
+
+    .. versionadded:: 4.1
+    """
+    app = current_app._get_current_object()
+    babel = get_babel()
+    contexts = list(contexts)
+
+    groups = {}
+    for index, context in enumerate(contexts):
+        locale = Locale.parse(context.get("locale") or babel.instance.default_locale)
+        key = str(locale), context.get("timezone") or babel.default_timezone
+        groups.setdefault(key, []).append(index)
+
+    def render(locale, tz, indexes):
+        with app.app_context():
+            ctx = _get_current_context()
+            ctx.babel_locale = Locale.parse(locale)
+            ctx.babel_tzinfo = _parse_timezone(tz)
+            return [
+                render_template(template_name_or_list, **contexts[index])
+                for index in indexes
+            ]
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        owners = {}
+        for (locale, tz), indexes in groups.items():
+            for start in range(0, len(indexes), chunk_size):
+                chunk = indexes[start : start + chunk_size]
+                future = executor.submit(render, locale, tz, chunk)
+                for position, index in enumerate(chunk):
+                    owners[index] = future, position
+
+        for index in range(len(contexts)):
+            future, position = owners.pop(index)
+            yield future.result()[position]
+
+
+def _localized_cache_key(*parts) -> str:
+    """Returns a cache key including the current locale, timezone and
+    domain, followed by `parts`.
+    """
+    domain = get_domain()
+    # Different domains may share a name, like overlays of the same base.
+    domain = "{}#{}".format(";".join(domain.domain), domain._cache_token)
+    parts = (get_locale(), get_timezone(), domain) + parts
+    return "flask_babel:" + ":".join(str(part) for part in parts)
+
+
+class FragmentCacheExtension(Extension):
+    """A Jinja extension caching parts of templates separately for every
+    locale, timezone and domain.  Enable it with::
+
+        app.jinja_env.add_extension("flask_babel.FragmentCacheExtension")
+
+    The part to cache is given a name and, optionally, the number of
+    seconds to cache it for::
+
+        {% cache "sidebar", 600 %}
+            ...
+        {% endcache %}
+
+    The rendered parts are kept in the cache store of the application, see
+    :meth:`Babel.init_app`.
+
+    .. versionadded:: 4.1
+    """
+
+    tags = {"cache"}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        if parser.stream.skip_if("comma"):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(None))
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        call = self.call_method("_cache", args)
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _cache(self, name, timeout, caller):
+        store = get_babel().cache_store
+        key = _localized_cache_key("fragment", name)
+        rv = store.get(key)
+        if rv is None:
+            rv = caller()
+            store.set(key, rv, timeout)
+        return rv
+
+
+def cached_view(timeout=None, vary=("Accept-Language",)):
+    """Caches the responses of a view separately for every locale,
+    timezone and domain, in the cache store of the application::
+
+        @app.route("/")
+        @cached_view(timeout=600)
+        def index():
+            ...
+
+    Only successful ``GET`` and ``HEAD`` requests are cached, and only the
+    body and mimetype of the response are kept.  Responses get an `ETag`,
+    so clients can revalidate them with conditional requests, and a `Vary`
+    header listing the request headers in `vary`, which should include
+    every header the locale and timezone selectors depend on.
+
+    .. versionadded:: 4.1
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(*args, **kwargs)
+
+            store = get_babel().cache_store
+            key = _localized_cache_key("view", request.full_path)
+            cached = store.get(key)
+            if cached is None:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200 or response.direct_passthrough:
+                    return response
+                response.add_etag()
+                etag, _ = response.get_etag()
+                store.set(key, (response.get_data(), response.mimetype, etag), timeout)
+            else:
+                data, mimetype, etag = cached
+                response = current_app.response_class(data, mimetype=mimetype)
+                response.set_etag(etag)
+
+            response.vary.update(vary)
+            return response.make_conditional(request)
+
+        return wrapper
+
+    return decorator
+
+
+def create_catalog_blueprint(domains=None, name="babel_catalogs") -> Blueprint:
+    """Creates a blueprint serving catalogs as JSON, for translating in the
+    browser with the same catalogs as the application::
+
+        app.register_blueprint(create_catalog_blueprint(), url_prefix="/i18n")
+
+    The catalog of a locale and domain is then served at
+    ``/i18n/<locale>/<domain>.json``, containing its plural expression and
+    its messages, with the translations of plural messages as lists::
+
+        {
+            "plural": "(n != 1)",
+            "messages": {"Yes": "Ja"},
+            "plurals": {"%(num)s Apple": ["%(num)s Apfel", "%(num)s Äpfel"]}
+        }
+
+    The JSON documents are built and compressed once per catalog, and
+    have an `ETag` derived from their content, so repeated requests can be
+    answered with ``304 Not Modified``.  Brotli compression is used if the
+    `brotli` package is installed, gzip otherwise.
+
+    :param domains: The :class:`Domain` instances to serve.  Defaults to
+                    the application's default domain.
+    :param name: The name of the blueprint.
+
+    .. versionadded:: 4.1
+    """
+    blueprint = Blueprint(name, __name__)
+
+    @blueprint.route("/<locale>/<domain>.json")
+    def catalog(locale, domain):
+        served = domains or [get_babel().instance.domain_instance]
+        for candidate in served:
+            if candidate.domain[0] == domain:
+                break
+        else:
+            abort(404)
+
+        try:
+            locale = Locale.parse(locale)
+        except (ValueError, UnknownLocaleError):
+            abort(404)
+
+        bodies = _get_json_catalog(candidate.get_locale_translations(locale))
+        encoding = request.accept_encodings.best_match(
+            [e for e in ("br", "gzip") if e in bodies]
+        )
+        etag, body = bodies[encoding or "identity"]
+
+        response = current_app.response_class(body, mimetype="application/json")
+        if encoding:
+            response.content_encoding = encoding
+        response.set_etag(etag)
+        response.vary.add("Accept-Encoding")
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    return blueprint
+
+
+_json_catalogs = weakref.WeakKeyDictionary()
+
+
+def _get_json_catalog(translations):
+    """Returns the ETags and bodies of a catalog as JSON document for every
+    supported content encoding.
+    """
+    try:
+        return _json_catalogs[translations]
+    except KeyError:
+        pass
+
+    catalog = getattr(translations, "_catalog", {})
+    messages = {}
+    plurals = {}
+    for key, value in catalog.items():
+        if isinstance(key, tuple):
+            forms = plurals.setdefault(key[0], [])
+            forms.extend([None] * (key[1] + 1 - len(forms)))
+            forms[key[1]] = value
+        elif key:
+            messages[key] = value
+
+    body = json.dumps(
+        {
+            "plural": _get_plural_forms(catalog),
+            "messages": messages,
+            "plurals": plurals,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    import gzip
+
+    etag = hashlib.sha256(body).hexdigest()
+    bodies = {
+        "identity": (etag, body),
+        "gzip": (etag + "-gzip", gzip.compress(body, mtime=0)),
+    }
+    try:
+        import brotli
+    except ImportError:
+        pass
+    else:
+        bodies["br"] = (etag + "-br", brotli.compress(body))
+
+    _json_catalogs[translations] = bodies
+    return bodies
+
+
+def _get_format(key, format, date_formats=None) -> Optional[str]:
     """A small helper for the datetime formatting functions.  Looks up
     format defaults for different kinds.
     """
-    babel = get_babel()
+    if date_formats is None:
+        date_formats = get_babel().instance.date_formats
     if format is None:
-        format = babel.instance.date_formats[key]
+        format = date_formats[key]
     if format in ("short", "medium", "full", "long"):
-        rv = babel.instance.date_formats["%s.%s" % (key, format)]
+        rv = date_formats["%s.%s" % (key, format)]
         if rv is not None:
             format = rv
     return format
@@ -363,9 +1262,12 @@ def to_user_timezone(datetime):
     to convert a :class:`datetime.datetime` object at any time to the user's
     timezone (as returned by :func:`get_timezone`) this function can be used.
     """
+    return _to_timezone(datetime, get_timezone())
+
+
+def _to_timezone(datetime, tzinfo):
     if datetime.tzinfo is None:
-        datetime = datetime.replace(tzinfo=UTC)
-    tzinfo = get_timezone()
+        datetime = datetime.replace(tzinfo=pytz.UTC)
     return tzinfo.normalize(datetime.astimezone(tzinfo))
 
 
@@ -375,9 +1277,10 @@ def to_utc(datetime):
     """
     if datetime.tzinfo is None:
         datetime = get_timezone().localize(datetime)
-    return datetime.astimezone(UTC).replace(tzinfo=None)
+    return datetime.astimezone(pytz.UTC).replace(tzinfo=None)
 
 
+@_memoized(uses_timezone=True)
 def format_datetime(datetime=None, format=None, rebase=True):
     """Return a date formatted according to the given pattern.  If no
     :class:`~datetime.datetime` object is passed, the current time is
@@ -398,6 +1301,7 @@ def format_datetime(datetime=None, format=None, rebase=True):
     return _date_format(dates.format_datetime, datetime, format, rebase)
 
 
+@_memoized(uses_timezone=True)
 def format_date(date=None, format=None, rebase=True):
     """Return a date formatted according to the given pattern.  If no
     :class:`~datetime.datetime` or :class:`~datetime.date` object is passed,
@@ -420,6 +1324,7 @@ def format_date(date=None, format=None, rebase=True):
     return _date_format(dates.format_date, date, format, rebase)
 
 
+@_memoized(uses_timezone=True)
 def format_time(time=None, format=None, rebase=True):
     """Return a time formatted according to the given pattern.  If no
     :class:`~datetime.datetime` object is passed, the current time is
@@ -471,6 +1376,7 @@ def _date_format(formatter, obj, format, rebase, **extra):
     return formatter(obj, format, locale=locale, **extra)
 
 
+@_memoized()
 def format_number(number) -> str:
     """Return the given number formatted for the locale in request
 
@@ -479,9 +1385,10 @@ def format_number(number) -> str:
     :rtype: unicode
     """
     locale = get_locale()
-    return numbers.format_decimal(number, locale=locale)
+    return _format_decimal(number, None, locale)
 
 
+@_memoized()
 def format_decimal(number, format=None) -> str:
     """Return the given decimal number formatted for the locale in the request.
 
@@ -491,9 +1398,74 @@ def format_decimal(number, format=None) -> str:
     :rtype: unicode
     """
     locale = get_locale()
+    return _format_decimal(number, format, locale)
+
+
+_integer_formats = {}
+
+
+def _get_integer_format(locale):
+    """Returns the affixes, group symbol and grouping sizes of the default
+    decimal pattern of `locale`, or `None` if the pattern does more than
+    grouping the digits of integers.
+    """
+    try:
+        return _integer_formats[locale]
+    except KeyError:
+        pass
+
+    pattern = locale.decimal_formats[None]
+    affixes = "".join(pattern.prefix + pattern.suffix)
+    if (
+        pattern.scale
+        or pattern.exp_prec
+        or "@" in pattern.pattern
+        or not pattern.number_pattern
+        or pattern.frac_prec[0]
+        or pattern.int_prec[0] > 1
+        or "'" in affixes
+        or "\xa4" in affixes
+    ):
+        rv = None
+    else:
+        symbol = numbers.get_group_symbol(locale)
+        rv = pattern.prefix, pattern.suffix, symbol, pattern.grouping
+
+    _integer_formats[locale] = rv
+    return rv
+
+
+def _format_decimal(number, format, locale) -> str:
+    """Formats integers with the default pattern of `locale` by grouping
+    their digits directly, which gives the same result as
+    :func:`babel.numbers.format_decimal` without converting them to
+    :class:`~decimal.Decimal`.  Everything else is passed on to Babel.
+    """
+    # Babel fails for integers exceeding the precision of the default
+    # decimal context, so leave those to it.
+    if (
+        format is None
+        and locale is not None
+        and type(number) is int
+        and -(10**24) < number < 10**24
+    ):
+        integer_format = _get_integer_format(locale)
+        if integer_format is not None:
+            prefix, suffix, symbol, grouping = integer_format
+            negative = number < 0
+            value = str(-number if negative else number)
+            size = grouping[0]
+            groups = ""
+            while len(value) > size:
+                groups = symbol + value[-size:] + groups
+                value = value[:-size]
+                size = grouping[1]
+            return prefix[negative] + value + groups + suffix[negative]
+
     return numbers.format_decimal(number, format=format, locale=locale)
 
 
+@_memoized()
 def format_currency(
     number, currency, format=None, currency_digits=True, format_type="standard"
 ) -> str:
@@ -520,6 +1492,7 @@ def format_currency(
     )
 
 
+@_memoized()
 def format_percent(number, format=None) -> str:
     """Return formatted percent value for the locale in the request.
 
@@ -532,6 +1505,7 @@ def format_percent(number, format=None) -> str:
     return numbers.format_percent(number, format=format, locale=locale)
 
 
+@_memoized()
 def format_scientific(number, format=None) -> str:
     """Return value formatted in scientific notation for the locale in request
 
@@ -544,6 +1518,278 @@ def format_scientific(number, format=None) -> str:
     return numbers.format_scientific(number, format=format, locale=locale)
 
 
+@dataclass(frozen=True)
+class Translator:
+    """Translates messages and formats values for a fixed locale and
+    timezone.  The translations are resolved when the translator is
+    created, so it can be used without a request or application context,
+    and it is safe to share between threads.  Use :meth:`Babel.translator`
+    to create one::
+
+        with app.app_context():
+            translator = babel.translator("de_DE", "Europe/Berlin")
+
+        for user in users:
+            send_email(user, translator.gettext("Hello %(name)s!", name=user.name))
+
+    .. versionadded:: 4.1
+    """
+
+    locale: Locale
+    tzinfo: tzinfo
+    translations: "support.NullTranslations"
+    date_formats: ImmutableDict
+
+    def gettext(self, string, **variables) -> str:
+        """Like :func:`gettext`, but for the locale of this translator."""
+        s = self.translations.ugettext(string)
+        return _interpolate(s, variables)
+
+    def ngettext(self, singular, plural, num, **variables) -> str:
+        """Like :func:`ngettext`, but for the locale of this translator."""
+        variables.setdefault("num", num)
+        s = self.translations.ungettext(singular, plural, num)
+        return _interpolate(s, variables)
+
+    def pgettext(self, context, string, **variables) -> str:
+        """Like :func:`pgettext`, but for the locale of this translator."""
+        s = self.translations.upgettext(context, string)
+        return _interpolate(s, variables)
+
+    def npgettext(self, context, singular, plural, num, **variables) -> str:
+        """Like :func:`npgettext`, but for the locale of this translator."""
+        variables.setdefault("num", num)
+        s = self.translations.unpgettext(context, singular, plural, num)
+        return _interpolate(s, variables)
+
+    def to_user_timezone(self, datetime):
+        """Like :func:`to_user_timezone`, but for the timezone of this
+        translator.
+        """
+        return _to_timezone(datetime, self.tzinfo)
+
+    def format_datetime(self, datetime=None, format=None, rebase=True) -> str:
+        """Like :func:`format_datetime`."""
+        format = _get_format("datetime", format, self.date_formats)
+        tzinfo = self.tzinfo if rebase else None
+        return dates.format_datetime(datetime, format, tzinfo, self.locale)
+
+    def format_date(self, date=None, format=None, rebase=True) -> str:
+        """Like :func:`format_date`."""
+        if rebase and isinstance(date, datetime):
+            date = self.to_user_timezone(date)
+        format = _get_format("date", format, self.date_formats)
+        return dates.format_date(date, format, self.locale)
+
+    def format_time(self, time=None, format=None, rebase=True) -> str:
+        """Like :func:`format_time`."""
+        format = _get_format("time", format, self.date_formats)
+        tzinfo = self.tzinfo if rebase else None
+        return dates.format_time(time, format, tzinfo, self.locale)
+
+    def format_timedelta(
+        self,
+        datetime_or_timedelta,
+        granularity: str = "second",
+        add_direction=False,
+        threshold=0.85,
+    ) -> str:
+        """Like :func:`format_timedelta`."""
+        if isinstance(datetime_or_timedelta, datetime):
+            datetime_or_timedelta = datetime.utcnow() - datetime_or_timedelta
+        return dates.format_timedelta(
+            datetime_or_timedelta,
+            granularity,
+            threshold=threshold,
+            add_direction=add_direction,
+            locale=self.locale,
+        )
+
+    def format_number(self, number) -> str:
+        """Like :func:`format_number`."""
+        return _format_decimal(number, None, self.locale)
+
+    def format_decimal(self, number, format=None) -> str:
+        """Like :func:`format_decimal`."""
+        return _format_decimal(number, format, self.locale)
+
+    def format_currency(
+        self,
+        number,
+        currency,
+        format=None,
+        currency_digits=True,
+        format_type="standard",
+    ) -> str:
+        """Like :func:`format_currency`."""
+        return numbers.format_currency(
+            number,
+            currency,
+            format=format,
+            locale=self.locale,
+            currency_digits=currency_digits,
+            format_type=format_type,
+        )
+
+    def format_percent(self, number, format=None) -> str:
+        """Like :func:`format_percent`."""
+        return numbers.format_percent(number, format=format, locale=self.locale)
+
+    def format_scientific(self, number, format=None) -> str:
+        """Like :func:`format_scientific`."""
+        return numbers.format_scientific(number, format=format, locale=self.locale)
+
+
+_collators = {}
+_sort_keys = _LRUCache(10000)
+
+
+def _get_collator(locale):
+    """Returns a function computing collation keys for `locale`.  These
+    follow the rules of the locale if PyICU is installed, or sort
+    independently of case and accents otherwise.
+    """
+    try:
+        return _collators[locale]
+    except KeyError:
+        pass
+
+    try:
+        import icu
+    except ImportError:
+        collator = _fallback_sort_key
+    else:
+        collator = icu.Collator.createInstance(icu.Locale(str(locale))).getSortKey
+
+    _collators[locale] = collator
+    return collator
+
+
+def _fallback_sort_key(string):
+    decomposed = unicodedata.normalize("NFKD", string).casefold()
+    base = "".join(c for c in decomposed if not unicodedata.combining(c))
+    # Like most collations, sort lowercase before uppercase letters.
+    return base, decomposed, string.swapcase()
+
+
+def sort_key(string, locale=None):
+    """Returns a key to sort `string` by the collation rules of `locale`,
+    which defaults to the current locale.  `string` can also be a lazy
+    string.  The keys are cached per locale and string::
+
+        choices.sort(key=sort_key)
+
+    Sorting follows the rules of the locale if `PyICU`_ is installed.
+    Otherwise strings are sorted independently of case and accents first,
+    which works well for most languages written in the Latin alphabet.
+
+    .. versionadded:: 4.1
+    """
+    locale = Locale.parse(locale) if locale is not None else get_locale()
+    return _sort_key(str(string), locale, _get_collator(locale))
+
+
+def _sort_key(string, locale, collate):
+    key = _sort_keys.get((locale, string))
+    if key is None:
+        key = collate(string)
+        _sort_keys.set((locale, string), key)
+    return key
+
+
+def sorted_localized(iterable, key=None, reverse=False, locale=None) -> list:
+    """Like :func:`sorted`, but sorts by the collation rules of `locale`,
+    which defaults to the current locale, as described for
+    :func:`sort_key`.  If given, `key` is called for each item and must
+    return the string, or lazy string, to sort the item by::
+
+        sorted_localized(choices, key=lambda choice: choice[1])
+
+    .. versionadded:: 4.1
+    """
+    locale = Locale.parse(locale) if locale is not None else get_locale()
+    collate = _get_collator(locale)
+
+    def item_key(item):
+        string = key(item) if key is not None else item
+        return _sort_key(str(string), locale, collate)
+
+    return sorted(iterable, key=item_key, reverse=reverse)
+
+
+_name_tables = _LRUCache(64)
+
+
+def _get_name_table(kind, locale, build):
+    """Returns the name table `kind` for `locale`, or the current locale,
+    building it with `build` if it is not cached yet.
+    """
+    locale = Locale.parse(locale) if locale is not None else get_locale()
+    key = kind, str(locale)
+    table = _name_tables.get(key)
+    if table is None:
+        collate = _get_collator(locale)
+        table = tuple(sorted(build(locale), key=lambda item: collate(item[1])))
+        _name_tables.set(key, table)
+    return table
+
+
+def get_timezone_names(locale=None) -> Tuple[Tuple[str, str], ...]:
+    """Returns the common timezones as ``(zone, name)`` pairs, sorted by
+    their name in `locale`, which defaults to the current locale.  This is
+    meant for timezone pickers and is also available in templates as
+    `timezone_names`::
+
+        <select name="timezone">
+        {% for zone, name in timezone_names() %}
+          <option value="{{ zone }}">{{ name }}</option>
+        {% endfor %}
+        </select>
+
+    The lists are built once per locale and cached.
+
+    .. versionadded:: 4.1
+    """
+    return _get_name_table(
+        "timezones",
+        locale,
+        lambda locale: (
+            (zone, dates.get_timezone_location(zone, locale=locale))
+            for zone in pytz.common_timezones
+        ),
+    )
+
+
+def get_territory_names(locale=None) -> Tuple[Tuple[str, str], ...]:
+    """Returns the countries and territories as ``(code, name)`` pairs,
+    sorted by their name in `locale`, which defaults to the current locale.
+    Regions such as continents are left out.  Also available in templates
+    as `territory_names`.
+
+    .. versionadded:: 4.1
+    """
+    return _get_name_table(
+        "territories",
+        locale,
+        lambda locale: (
+            (code, name) for code, name in locale.territories.items() if code.isalpha()
+        ),
+    )
+
+
+def get_language_names(locale=None) -> Tuple[Tuple[str, str], ...]:
+    """Returns the languages as ``(code, name)`` pairs, sorted by their
+    name in `locale`, which defaults to the current locale.  Also available
+    in templates as `language_names`.
+
+    .. versionadded:: 4.1
+    """
+    return _get_name_table("languages", locale, lambda locale: locale.languages.items())
+
+
+_domain_numbers = itertools.count()
+
+
 class Domain(object):
     """Localization domain. By default, it will look for translations in the
     Flask application directory and "messages" domain - all message catalogs
@@ -563,16 +1809,29 @@ class Domain(object):
                 "myapp",
             ]
         )
+
+    Catalogs can also be loaded from somewhere else than ``.mo`` files by
+    passing a :class:`CatalogSource`, such as a :class:`SQLiteCatalogSource`,
+    as ``source``.
     """
 
-    def __init__(self, translation_directories=None, domain="messages"):
+    def __init__(self, translation_directories=None, domain="messages", source=None):
         if isinstance(translation_directories, str):
             translation_directories = [translation_directories]
         self._translation_directories = translation_directories
 
         self.domain = domain.split(";")
+        self.source = source
+
+        self._caches = {}
+        self._versions = weakref.WeakKeyDictionary()
+
+        self._pending = {}
+        self._pending_lock = threading.Lock()
 
-        self.cache = {}
+        # Numbered in creation order rather than random, so the workers of an
+        # application agree on it when sharing a cache store.
+        self._cache_token = next(_domain_numbers)
 
     def __repr__(self):
         return "<Domain({!r}, {!r})>".format(self._translation_directories, self.domain)
@@ -592,6 +1851,30 @@ class Domain(object):
 
         ctx.babel_domain = self
 
+    @property
+    def cache(self):
+        """The cache of translations loaded from the translation
+        directories of the current application.  Applications sharing a
+        domain get separate caches unless they use the same directories.
+        Outside of an application context, domains without directories of
+        their own use a cache of their own.  Assigning replaces the cache of
+        the current directories.
+        """
+        directories = self._cache_directories()
+        try:
+            return self._caches[directories]
+        except KeyError:
+            return self._caches.setdefault(directories, {})
+
+    @cache.setter
+    def cache(self, value):
+        self._caches[self._cache_directories()] = value
+
+    def _cache_directories(self):
+        if self._translation_directories is None and not has_app_context():
+            return None
+        return tuple(self.translation_directories)
+
     def get_translations_cache(self, ctx):
         """Returns dictionary-like object for translation caching"""
         return self.cache
@@ -602,29 +1885,151 @@ class Domain(object):
         if ctx is None:
             return support.NullTranslations()
 
+        babel = get_babel()
         cache = self.get_translations_cache(ctx)
         locale = get_locale()
+        if babel.hot_set is not None:
+            babel.hot_set.record(str(locale), self.domain[0])
+
         try:
-            return cache[str(locale), self.domain[0]]
+            translations = cache[str(locale), self.domain[0]]
         except KeyError:
-            translations = support.Translations()
+            pass
+        else:
+            return self._revalidate(cache, locale, translations)
 
-            for index, dirname in enumerate(self.translation_directories):
+        if babel.background_loading:
+            self._load_in_background(cache, locale)
+            fallback = (str(babel.instance.default_locale), self.domain[0])
+            return cache.get(fallback) or support.NullTranslations()
 
-                domain = self.domain[0] if len(self.domain) == 1 else self.domain[index]
+        return self.get_locale_translations(locale)
 
-                catalog = support.Translations.load(dirname, [locale], domain)
-                translations.merge(catalog)
-                # FIXME: Workaround for merge() being really, really stupid. It
-                # does not copy _info, plural(), or any other instance variables
-                # populated by GNUTranslations. We probably want to stop using
-                # `support.Translations.merge` entirely.
-                if catalog.info() and hasattr(catalog, "plural"):
-                    translations.plural = catalog.plural
+    def get_locale_translations(self, locale):
+        """Returns the translations for `locale` rather than the locale of
+        the current request, loading them into the cache if required.  Must
+        be called within an application context.
 
+        .. versionadded:: 4.1
+        """
+        cache = self.get_translations_cache(_get_current_context())
+        try:
+            translations = cache[str(locale), self.domain[0]]
+        except KeyError:
+            translations = self._prepare_translations(locale)
             cache[str(locale), self.domain[0]] = translations
             return translations
 
+        return self._revalidate(cache, locale, translations)
+
+    def _revalidate(self, cache, locale, translations):
+        """Reloads `translations` if the version of the catalog in the
+        source changed, checking at most every
+        :attr:`CatalogSource.revalidate_interval` seconds.
+        """
+        if self.source is None:
+            return translations
+
+        version, checked_at = self._versions.get(translations, (None, 0))
+        now = time.monotonic()
+        if now - checked_at < self.source.revalidate_interval:
+            return translations
+
+        if self.source.get_version(locale, self.domain[0]) == version:
+            self._versions[translations] = version, now
+            return translations
+
+        translations = self._prepare_translations(locale)
+        cache[str(locale), self.domain[0]] = translations
+        return translations
+
+    def _prepare_translations(self, locale):
+        if self.source is None:
+            return self._share_translations(self.load_translations(locale))
+
+        translations, version = self.source.load(locale, self.domain[0])
+        # Record the version on the translations actually cached, which are
+        # the shared ones if an identical catalog was loaded before.
+        translations = self._share_translations(translations)
+        self._versions[translations] = version, time.monotonic()
+        return translations
+
+    def _share_translations(self, translations):
+        """Validates freshly loaded `translations`, and returns the
+        translations of another application instead if they were loaded from
+        identical files.
+        """
+        # Applications loading the same files from different directories
+        # share the translations instead of keeping a copy each.
+        digest = _catalog_digest(translations)
+        if digest is not None:
+            key = digest, get_babel().compact_catalogs
+            shared = _shared_catalogs.get(key)
+            if shared is None:
+                shared = _shared_catalogs.setdefault(
+                    key, _prepare_catalog(translations)
+                )
+            return shared
+
+        return _prepare_catalog(translations)
+
+    def _load_in_background(self, cache, locale):
+        """Schedules loading the catalog for `locale` into `cache`, unless
+        it is already being loaded.
+        """
+        key = str(locale), self.domain[0]
+        app = current_app._get_current_object()
+
+        def load():
+            try:
+                with app.app_context():
+                    cache[key] = self._prepare_translations(locale)
+            except Exception:
+                app.logger.exception("Failed to load translations for %s", key)
+            finally:
+                with self._pending_lock:
+                    del self._pending[key]
+
+        with self._pending_lock:
+            if key not in self._pending:
+                self._pending[key] = _get_loader_executor().submit(load)
+
+    def load_translations(self, locale):
+        """Loads the translations for `locale` from the translation
+        directories, or the source of the domain, bypassing the cache.
+        """
+        if self.source is not None:
+            return self.source.load(locale, self.domain[0])[0]
+
+        translations = support.Translations()
+
+        for index, dirname in enumerate(self.translation_directories):
+
+            domain = self.domain[0] if len(self.domain) == 1 else self.domain[index]
+
+            catalog = _load_mo(dirname, locale, domain)
+            _merge_translations(translations, catalog)
+            # FIXME: Workaround for merge() being really, really stupid. It
+            # does not copy _info, plural(), or any other instance variables
+            # populated by GNUTranslations. We probably want to stop using
+            # `support.Translations.merge` entirely.
+            if catalog.info() and hasattr(catalog, "plural"):
+                translations.plural = catalog.plural
+
+        return translations
+
+    def catalog_memory_usage(self):
+        """Returns the approximate memory used by each cached catalog, in
+        bytes, as a dictionary keyed by ``(locale, domain)``.  Strings shared
+        with other catalogs are counted for every catalog using them.
+
+        .. versionadded:: 4.1
+        """
+        return {
+            key: _catalog_size(translations)
+            for key, translations in list(self.cache.items())
+        }
+
     def gettext(self, string, **variables):
         """Translates a string with the current locale and passes in the
         given keyword arguments as mapping to a string formatting string.
@@ -636,7 +2041,7 @@ class Domain(object):
         """
         t = self.get_translations()
         s = t.ugettext(string)
-        return s if not variables else s % variables
+        return _interpolate(s, variables)
 
     def ngettext(self, singular, plural, num, **variables):
         """Translates a string with the current locale and passes in the
@@ -653,7 +2058,7 @@ class Domain(object):
         variables.setdefault("num", num)
         t = self.get_translations()
         s = t.ungettext(singular, plural, num)
-        return s if not variables else s % variables
+        return _interpolate(s, variables)
 
     def pgettext(self, context, string, **variables):
         """Like :func:`gettext` but with a context.
@@ -662,7 +2067,7 @@ class Domain(object):
         """
         t = self.get_translations()
         s = t.upgettext(context, string)
-        return s if not variables else s % variables
+        return _interpolate(s, variables)
 
     def npgettext(self, context, singular, plural, num, **variables):
         """Like :func:`ngettext` but with a context.
@@ -672,7 +2077,7 @@ class Domain(object):
         variables.setdefault("num", num)
         t = self.get_translations()
         s = t.unpgettext(context, singular, plural, num)
-        return s if not variables else s % variables
+        return _interpolate(s, variables)
 
     def lazy_gettext(self, string, **variables):
         """Like :func:`gettext` but the string returned is lazy which means
@@ -715,6 +2120,648 @@ class Domain(object):
         return LazyString(self.pgettext, context, string, **variables)
 
 
+_loader_lock = threading.Lock()
+_loader_executor = None
+
+
+def _get_loader_executor() -> ThreadPoolExecutor:
+    """Returns the thread pool used to load catalogs in the background."""
+    global _loader_executor
+    with _loader_lock:
+        if _loader_executor is None:
+            _loader_executor = ThreadPoolExecutor(
+                thread_name_prefix="flask-babel-loader"
+            )
+        return _loader_executor
+
+
+def _load_catalog_data(directories, domain, locale):
+    """Loads a catalog and returns it in a form that can be pickled, so it
+    can be parsed in another process.  See :func:`_build_translations`.
+    """
+    start = time.perf_counter()
+    translations = Domain(directories, ";".join(domain)).load_translations(locale)
+    catalog = translations._catalog
+    data = (
+        catalog,
+        _get_plural_forms(catalog),
+        getattr(translations, "_info", {}),
+        getattr(translations, "files", []),
+        getattr(translations, "_file_digests", {}),
+    )
+    return data, time.perf_counter() - start
+
+
+def _get_plural_forms(catalog) -> Optional[str]:
+    """Returns the plural expression from the metadata of a catalog."""
+    for line in catalog.get("", "").splitlines():
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "plural-forms":
+            return value.split("plural=")[1].split(";")[0].strip()
+    return None
+
+
+def _build_translations(catalog, plural=None, info=None, files=None, digests=None):
+    """Creates translations from a catalog dictionary as used by
+    :class:`gettext.GNUTranslations`, its plural expression and, if it was
+    loaded from files, its metadata and the paths and hashes of the files.
+    """
+    translations = support.Translations()
+    translations._catalog = catalog
+    if plural is not None:
+        translations.plural = _gettext.c2py(plural)
+    if info is not None:
+        translations._info = info
+    if files is not None:
+        translations.files = list(files)
+    if digests is not None:
+        translations._file_digests = dict(digests)
+    return translations
+
+
+def _load_mo(dirname, locale, domain):
+    """Loads the catalog of `domain` for `locale` from `dirname` like
+    :meth:`babel.support.Translations.load`, and records the hash of the
+    file.  The file is read once, so the hash is always the one of the
+    parsed content, even if the file is replaced in the meantime.
+    """
+    filename = _gettext.find(domain, dirname, [str(locale)])
+    if not filename:
+        return support.NullTranslations()
+
+    with open(filename, "rb") as f:
+        data = f.read()
+    translations = support.Translations(io.BytesIO(data), domain=domain)
+    translations.files = [filename]
+    translations._file_digests = {filename: hashlib.sha256(data).hexdigest()}
+    return translations
+
+
+def _merge_translations(translations, catalog):
+    """Merges `catalog` into `translations`, including the hashes of the
+    files it was loaded from.
+    """
+    translations.merge(catalog)
+    digests = getattr(catalog, "_file_digests", None)
+    if digests:
+        translations._file_digests = {
+            **getattr(translations, "_file_digests", {}),
+            **digests,
+        }
+
+
+_placeholder_re = re.compile(
+    r"%(?:\((?P<name>[^)]*)\))?[#0 +-]*(?:\*|\d+)?(?:\.(?:\*|\d+))?[hlL]?."
+)
+
+
+def _placeholder_names(string):
+    """Returns the names of the ``%(name)s`` placeholders in `string`."""
+    return {m.group("name") for m in _placeholder_re.finditer(string)} - {None}
+
+
+def _interpolate(string, variables):
+    """Formats a translated string with `variables`.  Strings without any
+    placeholders are returned as they are, which saves the formatting for
+    most messages, and for every :func:`ngettext` call without other
+    variables than `num`.
+    """
+    if not variables or "%" not in string:
+        return string
+    return string % variables
+
+
+_shared_catalogs = weakref.WeakValueDictionary()
+
+
+def _catalog_digest(translations) -> Optional[str]:
+    """Returns a hash of the files `translations` were loaded from, or
+    `None` if they were not loaded from files or their hashes are unknown.
+    The hashes are taken when loading, see :func:`_load_mo`.
+    """
+    files = getattr(translations, "files", None)
+    digests = getattr(translations, "_file_digests", {})
+    if not files or not all(path in digests for path in files):
+        return None
+
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(digests[path].encode("ascii"))
+    return digest.hexdigest()
+
+
+def _prepare_catalog(translations):
+    """Validates a freshly loaded catalog and compacts it if configured."""
+    _check_placeholders(getattr(translations, "_catalog", {}))
+    if get_babel().compact_catalogs:
+        _compact_catalog(translations)
+    return translations
+
+
+def _check_placeholders(catalog):
+    """Warns about translations using placeholders their message id does
+    not provide, which raise a :class:`KeyError` when they are formatted.
+    Translations are never removed: plural forms are skipped, as the keys
+    of a catalog do not include the plural message id, and so are message
+    ids without named placeholders, like symbolic ids such as
+    ``"greeting.hello"``.
+    """
+    for key, string in catalog.items():
+        if isinstance(key, tuple) or "%(" not in string:
+            continue
+        allowed = _placeholder_names(key.rpartition("\x04")[2])
+        if not allowed:
+            continue
+        unknown = _placeholder_names(string) - allowed
+        if unknown:
+            current_app.logger.warning(
+                "Translation %r of %r uses unknown placeholders %s",
+                string,
+                key,
+                ", ".join(sorted(unknown)),
+            )
+
+
+def _compact_catalog(translations):
+    """Interns the message ids and strings of a loaded catalog.  Catalogs
+    of different locales (and messages translated identically) then share
+    a single copy of each string instead of one per catalog.
+    """
+
+    def intern(value):
+        if isinstance(value, str):
+            return sys.intern(value)
+        if isinstance(value, tuple):
+            return tuple(intern(v) for v in value)
+        return value
+
+    # Rebuilding the dictionary also drops the slack left by merge().
+    translations._catalog = {
+        intern(key): intern(value) for key, value in translations._catalog.items()
+    }
+
+
+def _catalog_size(translations) -> int:
+    """Returns the approximate size of a catalog in bytes."""
+    catalog = getattr(translations, "_catalog", {})
+    seen = set()
+    size = sys.getsizeof(catalog)
+    for key, value in catalog.items():
+        for obj in (key, value, *(key if isinstance(key, tuple) else ())):
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                size += sys.getsizeof(obj)
+    return size
+
+
+class CatalogSource:
+    """Base class for loading catalogs from somewhere else than ``.mo``
+    files, see :class:`Domain`.  Subclasses implement :meth:`load` and, if
+    the catalogs can change while the application runs, :meth:`get_version`.
+
+    .. versionadded:: 4.1
+    """
+
+    #: How many seconds a loaded catalog is used before checking whether
+    #: its version changed.
+    revalidate_interval = 5
+
+    def load(self, locale, domain):
+        """Returns the translations of `domain` for `locale` and their
+        version as a tuple.
+        """
+        raise NotImplementedError()
+
+    def get_version(self, locale, domain):
+        """Returns the current version of the catalog of `domain` for
+        `locale`.  When it differs from the version returned by
+        :meth:`load`, the catalog is loaded again.
+        """
+        return None
+
+
+class SQLiteCatalogSource(CatalogSource):
+    """Loads catalogs from a SQLite database, one query per catalog.  The
+    database holds a ``catalogs`` table with the version and plural
+    expression of every catalog, and a ``messages`` table with the
+    messages of all catalogs.  Both are created if they do not exist yet,
+    and :meth:`save` fills them::
+
+        source = SQLiteCatalogSource("translations.sqlite")
+        source.save("de", "messages", {"Yes": "Ja"}, plural="(n != 1)")
+        domain = Domain(source=source)
+
+    Changes made with :meth:`save`, or otherwise followed by an update of
+    the version of the catalog, are picked up by running applications
+    within :attr:`revalidate_interval` seconds.
+
+    .. versionadded:: 4.1
+    """
+
+    def __init__(self, path, revalidate_interval=5):
+        self.path = path
+        self.revalidate_interval = revalidate_interval
+
+        with self._connect() as connection:
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS catalogs (
+                    locale TEXT NOT NULL,
+                    domain TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    plural TEXT,
+                    PRIMARY KEY (locale, domain)
+                );
+                CREATE TABLE IF NOT EXISTS messages (
+                    locale TEXT NOT NULL,
+                    domain TEXT NOT NULL,
+                    context TEXT,
+                    msgid TEXT NOT NULL,
+                    plural_index INTEGER,
+                    msgstr TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS messages_catalog
+                    ON messages (locale, domain);
+                """
+            )
+
+    def _connect(self):
+        import sqlite3
+
+        return closing(sqlite3.connect(self.path, isolation_level=None))
+
+    def _find_catalog(self, connection, locale, domain):
+        """Returns the locale, version and plural expression of the catalog
+        used for `locale`, falling back to the catalog of its language.
+        """
+        for name in dict.fromkeys((str(locale), Locale.parse(locale).language)):
+            row = connection.execute(
+                "SELECT version, plural FROM catalogs WHERE locale = ? AND domain = ?",
+                (name, domain),
+            ).fetchone()
+            if row is not None:
+                return (name, *row)
+        return None, None, None
+
+    def load(self, locale, domain):
+        with self._connect() as connection:
+            # Read the version and the messages from the same snapshot.
+            connection.execute("BEGIN")
+            name, version, plural = self._find_catalog(connection, locale, domain)
+            rows = connection.execute(
+                "SELECT context, msgid, plural_index, msgstr FROM messages "
+                "WHERE locale = ? AND domain = ?",
+                (name, domain),
+            )
+            catalog = {}
+            for context, msgid, index, msgstr in rows:
+                if context is not None:
+                    msgid = context + "\x04" + msgid
+                catalog[msgid if index is None else (msgid, index)] = msgstr
+            connection.execute("COMMIT")
+
+        return _build_translations(catalog, plural), version
+
+    def get_version(self, locale, domain):
+        with self._connect() as connection:
+            return self._find_catalog(connection, locale, domain)[1]
+
+    def save(self, locale, domain, messages, plural=None):
+        """Replaces the catalog of `domain` for `locale` with `messages` and
+        increments its version.  `messages` maps message ids to
+        translations like in :class:`OverlayDomain`.
+        """
+        rows = []
+        for key, msgstr in messages.items():
+            msgid, index = key if isinstance(key, tuple) else (key, None)
+            context, _, msgid = msgid.rpartition("\x04")
+            rows.append((str(locale), domain, context or None, msgid, index, msgstr))
+
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "DELETE FROM messages WHERE locale = ? AND domain = ?",
+                (str(locale), domain),
+            )
+            connection.executemany(
+                "INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            connection.execute(
+                "INSERT INTO catalogs VALUES (?, ?, 1, ?) "
+                "ON CONFLICT (locale, domain) "
+                "DO UPDATE SET version = version + 1, plural = excluded.plural",
+                (str(locale), domain, plural),
+            )
+            connection.execute("COMMIT")
+
+
+class DirectoryCatalogStore(CatalogSource):
+    """Distributes compiled catalogs to several nodes through a shared
+    directory, for example a network file system, or a local directory
+    during development and in tests.
+
+    Every set of catalogs is published as an immutable version named by
+    the hash of its content, and all nodes use the version activated
+    last::
+
+        store = DirectoryCatalogStore("/mnt/catalogs", cache_dir="/tmp/catalogs")
+        store.activate(store.publish("translations"))
+        domain = Domain(source=store)
+
+    Nodes copy a version to `cache_dir` once and keep its loaded catalogs
+    in memory, and look for a newly activated version at most every
+    `poll_interval` seconds.  The version is pinned for the rest of a
+    request when it is first used, so all domains switch to a new version
+    at once and a single page never mixes catalogs of two versions.
+
+    .. versionadded:: 4.1
+    """
+
+    # The version is pinned per request, so the domains check it on every
+    # lookup rather than keeping a catalog of a different version.
+    revalidate_interval = 0
+
+    def __init__(self, root, cache_dir=None, poll_interval=5):
+        self.root = root
+        self.cache_dir = cache_dir
+        self.poll_interval = poll_interval
+        self._current = None, 0
+        self._catalogs = {}
+        self._lock = threading.Lock()
+
+    def publish(self, translation_directory) -> str:
+        """Copies the compiled catalogs in `translation_directory` to the
+        store and returns their version, without activating it.
+        """
+        files = []
+        for dirpath, _, filenames in os.walk(translation_directory):
+            for filename in filenames:
+                if filename.endswith(".mo"):
+                    path = os.path.join(dirpath, filename)
+                    files.append(os.path.relpath(path, translation_directory))
+
+        digest = hashlib.sha256()
+        for name in sorted(files):
+            with open(os.path.join(translation_directory, name), "rb") as f:
+                data = f.read()
+            digest.update(name.replace(os.sep, "/").encode() + b"\0")
+            digest.update(len(data).to_bytes(8, "big"))
+            digest.update(data)
+        version = digest.hexdigest()[:16]
+
+        def copy(directory):
+            for name in files:
+                os.makedirs(
+                    os.path.join(directory, os.path.dirname(name)), exist_ok=True
+                )
+                shutil.copyfile(
+                    os.path.join(translation_directory, name),
+                    os.path.join(directory, name),
+                )
+
+        _install_directory(os.path.join(self.root, "versions", version), copy)
+        return version
+
+    def activate(self, version):
+        """Makes `version` the version used by all nodes."""
+        if not os.path.isdir(os.path.join(self.root, "versions", version)):
+            raise ValueError("unknown catalog version {!r}".format(version))
+        _write_atomic(os.path.join(self.root, "CURRENT"), version.encode())
+
+    def current_version(self) -> Optional[str]:
+        """Returns the active version, pinned for the current request."""
+        ctx = _get_current_context()
+        pinned = getattr(ctx, "babel_catalog_versions", None)
+        if pinned is None and ctx is not None:
+            pinned = ctx.babel_catalog_versions = {}
+        if pinned is not None and self in pinned:
+            return pinned[self]
+
+        version, checked_at = self._current
+        now = time.monotonic()
+        if version is None or now - checked_at >= self.poll_interval:
+            try:
+                with open(os.path.join(self.root, "CURRENT")) as f:
+                    version = f.read().strip() or None
+            except FileNotFoundError:
+                version = None
+            self._current = version, now
+
+        if pinned is not None:
+            pinned[self] = version
+        return version
+
+    def _fetch(self, version):
+        """Returns the local directory holding the catalogs of `version`."""
+        directory = os.path.join(self.root, "versions", version)
+        if self.cache_dir is None:
+            return directory
+
+        local = os.path.join(self.cache_dir, version)
+        if not os.path.isdir(local):
+            _install_directory(
+                local,
+                lambda tmp: shutil.copytree(directory, tmp, dirs_exist_ok=True),
+            )
+        return local
+
+    def load(self, locale, domain):
+        version = self.current_version()
+        if version is None:
+            return support.NullTranslations(), None
+
+        key = version, str(locale), domain
+        with self._lock:
+            translations = self._catalogs.get(key)
+            if translations is None:
+                translations = _load_mo(self._fetch(version), locale, domain)
+                # Only keep the catalogs of the versions still in use.
+                active = {version, self._current[0]}
+                self._catalogs = {
+                    k: v for k, v in self._catalogs.items() if k[0] in active
+                }
+                self._catalogs[key] = translations
+        return translations, version
+
+    def get_version(self, locale, domain):
+        return self.current_version()
+
+
+def _get_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _write_atomic(path, data):
+    """Writes `data` to `path` so that readers see either the old or the
+    new content, never a partially written file.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp() creates files only readable by their owner, but other
+        # users and nodes need to read them, so keep the mode of the file
+        # being replaced or use the default one.
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_get_umask()
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _install_directory(path, fill):
+    """Creates the directory `path` with its content written by `fill`
+    into a temporary directory, unless it exists already.
+    """
+    if os.path.isdir(path):
+        return
+
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+    try:
+        fill(tmp)
+        # Like for _write_atomic(), mkdtemp() creates private directories.
+        os.chmod(tmp, 0o777 & ~_get_umask())
+        os.rename(tmp, path)
+    except OSError:
+        # Another process installed the same directory first.
+        if not os.path.isdir(path):
+            raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+class CompositeDomain(Domain):
+    """A domain combining the messages of several domains into a single
+    catalog.  Domains earlier in the list take precedence over later ones
+    when they translate the same message::
+
+        domain = CompositeDomain([
+            Domain(domain="myapp"),
+            Domain("/path/to/plugin/translations", domain="plugin"),
+            Domain(),
+        ])
+
+    The catalogs are merged once per locale, so looking up a message is a
+    single dictionary lookup no matter how many domains are combined.
+
+    .. versionadded:: 4.1
+    """
+
+    def __init__(self, domains):
+        super().__init__()
+        self.domains = list(domains)
+        self.domain = [";".join(name for d in self.domains for name in d.domain)]
+
+    def __repr__(self):
+        return "<CompositeDomain({!r})>".format(self.domains)
+
+    def load_translations(self, locale):
+        translations = support.Translations()
+        plural = None
+
+        # Merge in reverse order so the messages of the first domains
+        # overwrite the ones of the later domains.
+        for domain in reversed(self.domains):
+            catalog = domain.load_translations(locale)
+            _merge_translations(translations, catalog)
+            if catalog.info() and hasattr(catalog, "plural"):
+                plural = catalog.plural
+
+        if plural is not None:
+            translations.plural = plural
+        return translations
+
+
+class OverlayDomain(Domain):
+    """A domain overriding some messages of another domain, for example
+    for every tenant of an application::
+
+        domain = OverlayDomain(get_babel().instance.domain_instance, {
+            "de": {"Yes": "Jawohl", ("%(num)s Apple", 1): "%(num)s Birnen"},
+        })
+
+    The overrides are given per locale as a mapping of message ids to
+    translations, using ``(msgid, index)`` for the plural forms of a
+    message and ``"context\x04msgid"`` for messages with a context.
+    Locales without overrides of their own use the ones of their language.
+
+    The catalogs of the base domain are shared rather than copied: a
+    message is looked up in the overrides first and in the catalog of the
+    base domain otherwise, so each overlay only costs the memory of its
+    overrides.
+
+    .. versionadded:: 4.1
+    """
+
+    def __init__(self, base, overrides):
+        super().__init__()
+        self.base = base
+        self.overrides = overrides
+        self.domain = list(base.domain)
+
+    def __repr__(self):
+        return "<OverlayDomain({!r})>".format(self.base)
+
+    @property
+    def translation_directories(self):
+        return self.base.translation_directories
+
+    def load_translations(self, locale):
+        return self._overlay(self.base.load_translations(locale), locale)
+
+    def _prepare_translations(self, locale):
+        # Layer the overrides over the cached catalog of the base domain
+        # instead of loading a copy of it.
+        return self._overlay(self.base.get_locale_translations(locale), locale)
+
+    def _revalidate(self, cache, locale, translations):
+        # The base domain replaces its catalog when reloading it, for
+        # example for a new version of its source.
+        base = self.base.get_locale_translations(locale)
+        if translations._catalog.maps[1] is getattr(base, "_catalog", _no_messages):
+            return translations
+
+        translations = self._overlay(base, locale)
+        cache[str(locale), self.domain[0]] = translations
+        return translations
+
+    def _overlay(self, base, locale):
+        locale = Locale.parse(locale)
+        overrides = self.overrides.get(str(locale))
+        if overrides is None:
+            overrides = self.overrides.get(locale.language, {})
+        overrides = dict(overrides)
+        _check_placeholders(overrides)
+        return _overlay_translations(base, overrides)
+
+
+#: The catalog of overlays over a base without messages.
+_no_messages = MappingProxyType({})
+
+
+def _overlay_translations(base, overrides):
+    """Returns translations looking up messages in `overrides` first and in
+    the catalog of `base` otherwise.
+    """
+    translations = support.Translations()
+    translations._catalog = ChainMap(overrides, getattr(base, "_catalog", _no_messages))
+    translations._info = base._info
+    translations._fallback = base._fallback
+    translations.plural = getattr(base, "plural", translations.plural)
+    return translations
+
+
 def _get_current_context() -> Optional[SimpleNamespace]:
     if not g:
         return None
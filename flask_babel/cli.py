@@ -0,0 +1,347 @@
+"""
+    flask_babel.cli
+    ~~~~~~~~~~~~~~~
+
+    The ``flask babel`` commands, registered by :meth:`Babel.init_app`.
+"""
+
+import hashlib
+import io
+import json
+import os
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from flask_babel import _write_atomic, get_babel
+
+babel_cli = AppGroup("babel", help="Manage the translations of the application.")
+
+#: The keywords of Flask-Babel recognized in addition to the ones of Babel.
+KEYWORDS = {
+    "lazy_gettext": None,
+    "lazy_ngettext": (1, 2),
+    "lazy_pgettext": ((1, "c"), 2),
+    "lazy_npgettext": ((1, "c"), 2, 3),
+}
+
+
+def _jinja_options(jinja_env):
+    """Returns the options of the Jinja extractor matching the configuration
+    of `jinja_env`, so templates are parsed like the application does.
+    """
+    options = {
+        "extensions": ",".join(jinja_env.extensions),
+        "newstyle_gettext": str(getattr(jinja_env, "newstyle_gettext", False)),
+        "trimmed": str(jinja_env.policies.get("ext.i18n.trimmed", False)),
+        "trim_blocks": str(jinja_env.trim_blocks),
+        "lstrip_blocks": str(jinja_env.lstrip_blocks),
+        "keep_trailing_newline": str(jinja_env.keep_trailing_newline),
+    }
+    for name in (
+        "block_start_string",
+        "block_end_string",
+        "variable_start_string",
+        "variable_end_string",
+        "comment_start_string",
+        "comment_end_string",
+        "line_statement_prefix",
+        "line_comment_prefix",
+    ):
+        if getattr(jinja_env, name) is not None:
+            options[name] = getattr(jinja_env, name)
+    return options
+
+
+def _get_method_map(mapping_file):
+    """Returns the extraction methods and their options, either from
+    `mapping_file` or for the Python code and templates of the application.
+    Templates always default to the Jinja configuration of the application.
+    """
+    jinja_options = _jinja_options(current_app.jinja_env)
+    if mapping_file is None:
+        template_folder = current_app.template_folder or "templates"
+        return [
+            ("**.py", "python", {}),
+            ("**/{}/**".format(template_folder), "jinja2", jinja_options),
+        ]
+
+    from babel.messages import frontend
+
+    # parse_mapping() was renamed in Babel 2.14.
+    parse = getattr(frontend, "parse_mapping_cfg", None) or frontend.parse_mapping
+    with open(mapping_file) as f:
+        method_map, options_map = parse(f)
+
+    result = []
+    for pattern, method in method_map:
+        options = dict(options_map.get(pattern, {}))
+        if "jinja2" in method:
+            options = {**jinja_options, **options}
+        result.append((pattern, method, options))
+    return result
+
+
+def _find_files(input_dirs, method_map):
+    """Yields the relative path, absolute path and extraction method of
+    every file in `input_dirs` to extract messages from.
+    """
+    from babel.messages import extract
+
+    for input_dir in input_dirs:
+        for root, dirnames, filenames in os.walk(input_dir):
+            dirnames[:] = sorted(d for d in dirnames if d[0] not in "._")
+            for filename in sorted(filenames):
+                path = os.path.join(root, filename)
+                relative = os.path.relpath(path, input_dir).replace(os.sep, "/")
+                for pattern, method, options in method_map:
+                    if extract.pathmatch(pattern, relative):
+                        yield relative, path, method, options
+                        break
+
+
+def _extract_file(path, method, keywords, comment_tags, options):
+    """Extracts the messages of one file, in a worker process."""
+    from babel.messages import extract
+
+    return [
+        [lineno, message, comments, context]
+        for lineno, message, comments, context in extract.extract_from_file(
+            method,
+            path,
+            keywords=keywords,
+            comment_tags=comment_tags,
+            options=options,
+            strip_comment_tags=True,
+        )
+    ]
+
+
+def _load_cache(path, config):
+    """Returns the cached messages per file, or an empty cache if `path`
+    does not exist or was written with a different configuration.
+    """
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("config") != config:
+        return {}
+    return cache["files"]
+
+
+@babel_cli.command("extract")
+@click.argument("input_dirs", nargs=-1, type=click.Path(exists=True))
+@click.option("-o", "--output", help="The .pot file to write.")
+@click.option(
+    "-F", "--mapping", "mapping_file", help="A mapping file as used by pybabel."
+)
+@click.option(
+    "-k", "--keyword", "keywords", multiple=True, help="An additional keyword."
+)
+@click.option(
+    "-c",
+    "--add-comments",
+    "comment_tags",
+    multiple=True,
+    help="Extract comments starting with this tag.",
+)
+@click.option("-j", "--jobs", type=int, help="The number of worker processes.")
+@click.option("--cache", "cache_file", help="The cache of extracted messages.")
+@click.option("--no-cache", is_flag=True, help="Extract every file again.")
+def extract_command(
+    input_dirs, output, mapping_file, keywords, comment_tags, jobs, cache_file, no_cache
+):
+    """Extracts the messages of the application into a .pot file.
+
+    Files are extracted in parallel, and only the files which changed
+    since the last extraction are extracted again.  Templates are parsed
+    with the Jinja configuration of the application.
+    """
+    # Babel's message tools are only imported when a command runs, to keep
+    # the startup of applications registering the commands fast.
+    from concurrent.futures import ProcessPoolExecutor
+
+    from babel.messages import extract, frontend
+    from babel.messages.catalog import Catalog
+    from babel.messages.pofile import write_po
+
+    domain = get_babel().domain_instance
+    input_dirs = input_dirs or [current_app.root_path]
+    if output is None:
+        output = os.path.join(
+            domain.translation_directories[0], domain.domain[0] + ".pot"
+        )
+    if cache_file is None:
+        cache_file = os.path.join(current_app.instance_path, "babel-extract-cache.json")
+
+    method_map = _get_method_map(mapping_file)
+    keywords = {
+        **extract.DEFAULT_KEYWORDS,
+        **KEYWORDS,
+        **frontend.parse_keywords(keywords),
+    }
+    comment_tags = list(comment_tags)
+
+    # Extracting a file again is only needed when its content changed or
+    # it would be extracted differently.
+    config = hashlib.sha256(
+        repr((method_map, sorted(keywords.items()), comment_tags)).encode()
+    ).hexdigest()
+    cached = {} if no_cache else _load_cache(cache_file, config)
+
+    files = {}
+    pending = []
+    for relative, path, method, options in _find_files(input_dirs, method_map):
+        stat = os.stat(path)
+        entry = cached.get(path)
+        if entry is not None and entry["stat"] == [stat.st_mtime_ns, stat.st_size]:
+            files[path] = entry
+            continue
+
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        files[path] = {
+            "relative": relative,
+            "stat": [stat.st_mtime_ns, stat.st_size],
+            "hash": digest,
+            "messages": None,
+        }
+        if entry is not None and entry["hash"] == digest:
+            files[path]["messages"] = entry["messages"]
+        else:
+            pending.append((path, method, options))
+
+    if len(pending) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(
+                    _extract_file, path, method, keywords, comment_tags, options
+                )
+                for path, method, options in pending
+            ]
+            for (path, _, _), future in zip(pending, futures):
+                files[path]["messages"] = future.result()
+    else:
+        for path, method, options in pending:
+            files[path]["messages"] = _extract_file(
+                path, method, keywords, comment_tags, options
+            )
+
+    catalog = Catalog(fuzzy=False, charset="utf-8")
+    for path, entry in files.items():
+        location = os.path.relpath(path, current_app.root_path).replace(os.sep, "/")
+        for lineno, message, comments, context in entry["messages"]:
+            if isinstance(message, list):
+                message = tuple(message)
+            catalog.add(
+                message,
+                None,
+                [(location, lineno)],
+                auto_comments=comments,
+                context=context,
+            )
+
+    buffer = io.BytesIO()
+    write_po(buffer, catalog, width=76)
+    _write_atomic(output, buffer.getvalue())
+
+    if not no_cache:
+        _write_atomic(
+            cache_file,
+            json.dumps({"config": config, "files": files}).encode(),
+        )
+
+    click.echo(
+        "Extracted {} messages from {} files ({} changed) into {}".format(
+            len(catalog), len(files), len(pending), output
+        )
+    )
+
+
+def _find_catalogs(directories, domains):
+    """Yields the .po and .mo paths of every catalog of `domains` in
+    `directories`.
+    """
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        for locale in sorted(os.listdir(directory)):
+            for domain in domains:
+                path = os.path.join(directory, locale, "LC_MESSAGES", domain)
+                if os.path.isfile(path + ".po"):
+                    yield path + ".po", path + ".mo"
+
+
+def _compile_file(po_path, mo_path, use_fuzzy):
+    """Compiles one catalog, in a worker process.  Returns the number of
+    messages compiled, or `None` if the catalog is fuzzy.
+    """
+    from babel.messages.mofile import write_mo
+    from babel.messages.pofile import read_po
+
+    with open(po_path, "rb") as f:
+        catalog = read_po(f)
+    if catalog.fuzzy and not use_fuzzy:
+        return None
+
+    buffer = io.BytesIO()
+    write_mo(buffer, catalog, use_fuzzy=use_fuzzy)
+    # Running applications reloading their translations must never see a
+    # partially written catalog.
+    _write_atomic(mo_path, buffer.getvalue())
+    return len(catalog)
+
+
+@babel_cli.command("compile")
+@click.option(
+    "-f", "--use-fuzzy", is_flag=True, help="Also compile fuzzy translations."
+)
+@click.option("-j", "--jobs", type=int, help="The number of worker processes.")
+@click.option("--force", is_flag=True, help="Compile every catalog again.")
+def compile_command(use_fuzzy, jobs, force):
+    """Compiles the catalogs of the application into .mo files.
+
+    Only catalogs changed since they were last compiled are compiled,
+    in parallel, and every .mo file is replaced atomically.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    domain = get_babel().domain_instance
+    pending = [
+        (po_path, mo_path)
+        for po_path, mo_path in _find_catalogs(
+            domain.translation_directories, domain.domain
+        )
+        if force
+        or not os.path.exists(mo_path)
+        or os.stat(po_path).st_mtime_ns > os.stat(mo_path).st_mtime_ns
+    ]
+
+    if len(pending) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(
+                executor.map(
+                    _compile_file,
+                    [po_path for po_path, _ in pending],
+                    [mo_path for _, mo_path in pending],
+                    [use_fuzzy] * len(pending),
+                )
+            )
+    else:
+        results = [
+            _compile_file(po_path, mo_path, use_fuzzy) for po_path, mo_path in pending
+        ]
+
+    for (po_path, mo_path), count in zip(pending, results):
+        if count is None:
+            click.echo("Skipping fuzzy catalog {}".format(po_path))
+        else:
+            click.echo("Compiled {} messages into {}".format(count, mo_path))
+    skipped = results.count(None)
+    summary = "{} catalogs compiled".format(len(results) - skipped)
+    if skipped:
+        summary += ", {} fuzzy catalogs skipped".format(skipped)
+    click.echo(summary)
@@ -0,0 +1,104 @@
+import os
+import stat
+
+import flask
+from babel.messages.catalog import Catalog
+from babel.messages.pofile import read_po, write_po
+
+import flask_babel as babel
+
+
+def test_extract(tmp_path):
+    app = flask.Flask(__name__)
+    app.jinja_env.line_statement_prefix = "%"
+    babel.Babel(app)
+
+    (tmp_path / "views.py").write_text('lazy_gettext("Yes")\n')
+    (tmp_path / "forms.py").write_text(
+        'ngettext("%(num)s Apple", "%(num)s Apples", 2)\n'
+    )
+    (tmp_path / "templates").mkdir()
+    (tmp_path / "templates" / "index.html").write_text(
+        "% trans trimmed\nHello\n% endtrans\n"
+    )
+    output = tmp_path / "messages.pot"
+    args = [
+        "babel",
+        "extract",
+        str(tmp_path),
+        "-o",
+        str(output),
+        "--cache",
+        str(tmp_path / "cache.json"),
+        "-j",
+        "2",
+    ]
+
+    result = app.test_cli_runner().invoke(args=args)
+    assert result.exit_code == 0, result.output
+    assert "(3 changed)" in result.output
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(output.stat().st_mode) == 0o666 & ~umask
+    with open(output, "rb") as f:
+        catalog = read_po(f)
+    assert [message.id for message in catalog if message.id] == [
+        ("%(num)s Apple", "%(num)s Apples"),
+        "Yes",
+        "Hello",
+    ]
+
+    (tmp_path / "views.py").write_text('lazy_gettext("No")\n')
+    result = app.test_cli_runner().invoke(args=args)
+    assert "(1 changed)" in result.output
+    with open(output, "rb") as f:
+        catalog = read_po(f)
+    assert "No" in catalog and "Yes" not in catalog and "Hello" in catalog
+
+
+def test_compile(tmp_path):
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_translation_directories=str(tmp_path))
+
+    for locale in ("de", "ja"):
+        directory = tmp_path / locale / "LC_MESSAGES"
+        directory.mkdir(parents=True)
+        catalog = Catalog(locale=locale, fuzzy=False)
+        catalog.add("Yes", {"de": "Ja", "ja": "はい"}[locale])
+        with open(directory / "messages.po", "wb") as f:
+            write_po(f, catalog)
+
+    result = app.test_cli_runner().invoke(args=["babel", "compile", "-j", "2"])
+    assert result.exit_code == 0, result.output
+    assert "2 catalogs compiled" in result.output
+    with app.test_request_context():
+        with babel.force_locale("ja"):
+            assert babel.gettext("Yes") == "はい"
+
+    result = app.test_cli_runner().invoke(args=["babel", "compile"])
+    assert "0 catalogs compiled" in result.output
+
+    po_path = tmp_path / "de" / "LC_MESSAGES" / "messages.po"
+    mo_path = tmp_path / "de" / "LC_MESSAGES" / "messages.mo"
+    mtime = mo_path.stat().st_mtime_ns
+    os.utime(po_path, ns=(mtime + 10**9, mtime + 10**9))
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(mo_path.stat().st_mode) == 0o666 & ~umask
+    os.chmod(mo_path, 0o640)
+    result = app.test_cli_runner().invoke(args=["babel", "compile"])
+    assert "1 catalogs compiled" in result.output
+    assert sorted(os.listdir(mo_path.parent)) == ["messages.mo", "messages.po"]
+    assert stat.S_IMODE(mo_path.stat().st_mode) == 0o640
+
+    # Fuzzy catalogs are only compiled with --use-fuzzy.
+    catalog = Catalog(locale="de", fuzzy=True)
+    catalog.add("Yes", "Jawohl")
+    with open(po_path, "wb") as f:
+        write_po(f, catalog)
+    os.utime(po_path, ns=(mtime + 2 * 10**9, mtime + 2 * 10**9))
+    result = app.test_cli_runner().invoke(args=["babel", "compile"])
+    assert "Skipping fuzzy catalog" in result.output
+    assert "0 catalogs compiled, 1 fuzzy catalogs skipped" in result.output
+    result = app.test_cli_runner().invoke(args=["babel", "compile", "--use-fuzzy"])
+    assert "1 catalogs compiled\n" in result.output
@@ -0,0 +1,136 @@
+import asyncio
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import flask
+
+import flask_babel as babel
+
+THREADS = 8
+REQUESTS = 400
+
+EXPECTED = {"de": "Ja", "ja": "はい", "en": "Yes"}
+TEMPLATE = "{{ get_locale() }}:{{ _('Yes') }}"
+
+
+def _make_app():
+    # Every app starts with empty caches, so the first requests race on
+    # loading the catalogs.
+    app = flask.Flask(__name__)
+    babel.Babel(app, locale_selector=lambda: flask.request.args["lang"])
+    app.jinja_env.globals["get_locale"] = babel.get_locale
+    return app
+
+
+def _locale_for(i):
+    return list(EXPECTED)[i % len(EXPECTED)]
+
+
+def _check(lang, rendered):
+    assert rendered == "{}:{}".format(lang, EXPECTED[lang])
+
+
+def _run(name, record_property, func, concurrency=THREADS):
+    """Runs `func` for every request on `concurrency` threads and records
+    throughput and latency percentiles of the scenario.
+    """
+    latencies = []
+
+    def timed(i):
+        start = time.perf_counter()
+        func(i)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(timed, range(REQUESTS)))
+    _report(name, record_property, latencies, time.perf_counter() - start)
+
+
+def _report(name, record_property, latencies, elapsed):
+    quantiles = statistics.quantiles(latencies, n=100)
+    stats = {
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+    }
+    for key, value in stats.items():
+        record_property("{}_{}".format(name, key), round(value, 3))
+    sys.stdout.write(
+        "\n{}: {throughput:.0f} req/s, p50 {p50_ms:.2f} ms, "
+        "p99 {p99_ms:.2f} ms\n".format(name, **stats)
+    )
+
+
+def test_threads_render_mixed_locales(record_property):
+    app = _make_app()
+
+    def request(i):
+        lang = _locale_for(i)
+        with app.test_request_context("/?lang=" + lang):
+            _check(lang, flask.render_template_string(TEMPLATE))
+
+    _run("threads", record_property, request)
+
+
+def test_threads_force_locale_and_refresh(record_property):
+    app = _make_app()
+
+    def request(i):
+        lang = _locale_for(i)
+        forced = _locale_for(i + 1)
+        with app.test_request_context("/?lang=" + lang):
+            _check(lang, flask.render_template_string(TEMPLATE))
+            with babel.force_locale(forced):
+                _check(forced, flask.render_template_string(TEMPLATE))
+            _check(lang, flask.render_template_string(TEMPLATE))
+            babel.refresh()
+            _check(lang, flask.render_template_string(TEMPLATE))
+
+    _run("force_locale", record_property, request)
+
+
+def test_threads_share_domain_cache(record_property):
+    app = _make_app()
+
+    def request(i):
+        lang = _locale_for(i)
+        with app.test_request_context("/?lang=" + lang):
+            if i % 50 == 0:
+                # Dropping the cache makes other threads load catalogs again
+                # while this one is still reading them.
+                babel.get_babel().domain_instance.cache.clear()
+            _check(lang, flask.render_template_string(TEMPLATE))
+
+    _run("domain_cache", record_property, request)
+
+    with app.app_context():
+        cache = babel.get_babel().domain_instance.cache
+        assert set(cache) <= {(lang, "messages") for lang in EXPECTED}
+
+
+def test_async_tasks_render_mixed_locales(record_property):
+    app = _make_app()
+    latencies = []
+
+    async def request(i):
+        lang = _locale_for(i)
+        start = time.perf_counter()
+        with app.test_request_context("/?lang=" + lang):
+            assert str(babel.get_locale()) == lang
+            # Let the other tasks run while this request is active.
+            await asyncio.sleep(0)
+            _check(lang, flask.render_template_string(TEMPLATE))
+            with babel.force_locale(_locale_for(i + 1)):
+                await asyncio.sleep(0)
+            _check(lang, flask.render_template_string(TEMPLATE))
+        latencies.append(time.perf_counter() - start)
+
+    async def main():
+        await asyncio.gather(*(request(i) for i in range(REQUESTS)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    _report("async", record_property, latencies, time.perf_counter() - start)
@@ -80,3 +80,19 @@ def test_refreshing():
         get_babel(app).default_timezone = "Europe/Vienna"
         babel.refresh()
         assert babel.format_datetime(d) == "Apr 12, 2010, 3:46:00\u202fPM"
+
+
+def test_format_cache():
+    app = flask.Flask(__name__)
+    b = babel.Babel(app, format_cache_size=10)
+    d = datetime(2010, 4, 12, 13, 46)
+
+    with app.test_request_context():
+        assert babel.format_time(d) == "1:46:00\u202fPM"
+        assert babel.format_time(d) == "1:46:00\u202fPM"
+        assert babel.format_date(None, "yyyy") == babel.format_date(None, "yyyy")
+        assert b.format_cache_info().hits == 1
+
+    with app.test_request_context():
+        get_babel(app).default_timezone = "Europe/Vienna"
+        assert babel.format_time(d) == "3:46:00\u202fPM"
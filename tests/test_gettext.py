@@ -1,4 +1,13 @@
+import json
+import os
+import stat
+import time
+from datetime import datetime
+
 import flask
+from babel import Locale
+from babel.messages.catalog import Catalog
+from babel.messages.mofile import write_mo
 
 import flask_babel as babel
 from flask_babel import gettext, lazy_gettext, lazy_ngettext, ngettext, get_babel
@@ -168,9 +177,7 @@ def test_multiple_apps():
 
 
 def test_cache(mocker):
-    load_mock = mocker.patch(
-        "babel.support.Translations.load", side_effect=babel.support.Translations.load
-    )
+    load_mock = mocker.patch("flask_babel._load_mo", side_effect=babel._load_mo)
 
     app = flask.Flask(__name__)
     b = babel.Babel(app, default_locale="de_DE", locale_selector=lambda: the_locale)
@@ -278,3 +285,394 @@ def test_plurals_different_domains():
 
         assert ngettext("%(num)s Apple", "%(num)s Apples", 1) == "リンゴ 1 個"
         assert ngettext("%(num)s Apple", "%(num)s Apples", 2) == "リンゴ 2 個"
+
+
+def test_composite_domain():
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+    domain = babel.CompositeDomain([babel.Domain(domain="test"), babel.Domain()])
+
+    with app.test_request_context():
+        assert domain.gettext("first") == "erste"
+        assert domain.gettext("Yes") == "Ja"
+        assert domain.ngettext("%(num)s Apple", "%(num)s Apples", 2) == "2 Äpfel"
+        assert set(domain.cache) == {("de_DE", "test;messages")}
+
+
+def test_composite_domain_precedence(tmp_path):
+    for name, translation in (("first", "Ja!"), ("second", "Jawohl")):
+        catalog = Catalog(locale="de", domain=name)
+        catalog.add("Yes", translation)
+        path = tmp_path / name / "de" / "LC_MESSAGES"
+        path.mkdir(parents=True)
+        with open(path / "{}.mo".format(name), "wb") as f:
+            write_mo(f, catalog)
+
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de")
+    domain = babel.CompositeDomain(
+        [
+            babel.Domain(str(tmp_path / "second"), domain="second"),
+            babel.Domain(str(tmp_path / "first"), domain="first"),
+        ]
+    )
+
+    with app.test_request_context():
+        assert domain.gettext("Yes") == "Jawohl"
+
+
+def test_compact_catalogs():
+    app = flask.Flask(__name__)
+    b = babel.Babel(app, locale_selector=lambda: the_locale, compact_catalogs=True)
+
+    catalogs = []
+    for the_locale in ("de", "ja"):
+        with app.test_request_context():
+            assert babel.gettext("Yes") != "Yes"
+            catalogs.append(babel.get_translations()._catalog)
+
+    de, ja = ({key: key for key in catalog} for catalog in catalogs)
+    assert de["Yes"] is ja["Yes"]
+
+    with app.app_context():
+        usage = b.domain_instance.catalog_memory_usage()
+    assert set(usage) == {("de", "messages"), ("ja", "messages")}
+    assert all(size > 0 for size in usage.values())
+
+
+def test_background_loading():
+    app = flask.Flask(__name__)
+    b = babel.Babel(app, locale_selector=lambda: "de_DE", background_loading=True)
+
+    with app.test_request_context():
+        cache = b.domain_instance.cache
+        assert gettext("Yes") == "Yes"
+
+    for _ in range(100):
+        if ("de_DE", "messages") in cache:
+            break
+        time.sleep(0.05)
+
+    with app.test_request_context():
+        assert gettext("Yes") == "Ja"
+
+
+def test_preload_translations(mocker):
+    app = flask.Flask(__name__)
+    b = babel.Babel(app, locale_selector=lambda: "ja")
+
+    with app.app_context():
+        loaded = b.preload_translations()
+        assert {(item.locale, item.domain) for item in loaded} == {
+            ("de", "messages"),
+            ("ja", "messages"),
+            ("en", "messages"),
+        }
+        assert all(item.seconds >= 0 for item in loaded)
+
+        # Domains get the same Locale objects as when translating.
+        prepare_mock = mocker.patch.object(
+            b.domain_instance,
+            "_prepare_translations",
+            wraps=b.domain_instance._prepare_translations,
+        )
+        b.preload_translations()
+        assert prepare_mock.call_count == 3
+        assert all(
+            isinstance(call.args[0], Locale) for call in prepare_mock.call_args_list
+        )
+
+    load_mock = mocker.patch("flask_babel._load_mo")
+    with app.test_request_context():
+        assert ngettext("%(num)s Apple", "%(num)s Apples", 2) == "リンゴ 2 個"
+    assert load_mock.call_count == 0
+
+
+def test_preload_translations_in_processes():
+    app = flask.Flask(__name__)
+    b = babel.Babel(app, locale_selector=lambda: "de")
+    domain = babel.Domain(domain="test")
+
+    with app.app_context():
+        b.preload_translations([b.domain_instance, domain], use_processes=True)
+
+    with app.test_request_context():
+        assert set(domain.cache) == {("de", "test"), ("ja", "test"), ("en", "test")}
+        assert domain.gettext("first") == "erste"
+        assert ngettext("%(num)s Apple", "%(num)s Apples", 1) == "1 Apfel"
+        assert ngettext("%(num)s Apple", "%(num)s Apples", 2) == "2 Äpfel"
+        translations = domain.get_translations()
+        loaded = babel.Domain(domain="test").load_translations("de")
+        assert translations.info() == loaded.info()
+        assert translations.files == loaded.files
+
+    # Catalogs parsed in other processes are shared like any other.
+    other = flask.Flask(__name__)
+    babel.Babel(other, locale_selector=lambda: "de")
+    with other.test_request_context():
+        assert babel.Domain(domain="test").get_translations() is translations
+
+
+def test_render_templates_bulk():
+    app = flask.Flask(__name__)
+    babel.Babel(app, locale_selector=lambda: flask.request.args["lang"])
+    when = datetime(2010, 4, 12, 13, 46)
+    contexts = [
+        {"locale": "de_DE", "name": "Peter", "when": when},
+        {"locale": "en_US", "timezone": "Europe/Vienna", "name": "Paul", "when": when},
+        {"locale": "de_DE", "timezone": "Asia/Tokyo", "name": "Mary", "when": when},
+        {"name": "Jane", "when": when},
+        {"locale": "de_DE", "name": "Joe", "when": when},
+    ]
+
+    with app.app_context():
+        rendered = list(babel.render_templates_bulk("greeting.txt", contexts, 2, 1))
+
+    assert rendered == [
+        "Hallo Peter! 13:46",
+        "Hello Paul! 15:46",
+        "Hallo Mary! 22:46",
+        "Hello Jane! 13:46",
+        "Hallo Joe! 13:46",
+    ]
+
+
+def test_hot_set(tmp_path, mocker):
+    hot_set_file = str(tmp_path / "hot_set.json")
+    app = flask.Flask(__name__)
+    app.config["BABEL_HOT_SET_INTERVAL"] = 0
+    babel.Babel(app, locale_selector=lambda: the_locale, hot_set_file=hot_set_file)
+
+    for the_locale in ("ja", "de", "de"):
+        with app.test_request_context():
+            gettext("Yes")
+
+    with open(hot_set_file) as f:
+        assert json.load(f) == [["de", "messages", 2], ["ja", "messages", 1]]
+
+    load_mock = mocker.patch("flask_babel._load_mo", side_effect=babel._load_mo)
+    app = flask.Flask(__name__)
+    b = babel.Babel(app, hot_set_file=hot_set_file)
+    assert [str(call.args[1]) for call in load_mock.call_args_list] == ["de", "ja"]
+
+    with app.app_context():
+        assert list(b.domain_instance.cache) == [
+            ("de", "messages"),
+            ("ja", "messages"),
+        ]
+
+
+def test_hot_set_save_failure(tmp_path, caplog):
+    hot_set_file = tmp_path / "data" / "hot_set.json"
+    hot_set_file.parent.mkdir()
+    app = flask.Flask(__name__)
+    app.config["BABEL_HOT_SET_INTERVAL"] = 0
+    babel.Babel(app, default_locale="de", hot_set_file=str(hot_set_file))
+
+    hot_set_file.parent.rmdir()
+    hot_set_file.parent.write_text("not a directory")
+    with app.test_request_context():
+        assert gettext("Yes") == "Ja"
+    assert "Failed to save the hot set" in caplog.text
+
+
+def test_hot_set_invalid_file(tmp_path, caplog):
+    hot_set_file = tmp_path / "hot_set.json"
+    hot_set_file.write_text('[["de", "messages"')
+    app = flask.Flask(__name__)
+    b = babel.Babel(app, default_locale="de", hot_set_file=str(hot_set_file))
+    assert "Failed to load the hot set" in caplog.text
+    with app.app_context():
+        assert not b.domain_instance.cache
+
+    # Entries for unknown locales are skipped, and the others still loaded.
+    hot_set_file.write_text(
+        json.dumps([["xx_INVALID", "messages", 2], ["de", "messages", 1]])
+    )
+    app = flask.Flask(__name__)
+    b = babel.Babel(app, default_locale="de", hot_set_file=str(hot_set_file))
+    assert "Failed to prewarm the catalog of xx_INVALID" in caplog.text
+    with app.app_context():
+        assert list(b.domain_instance.cache) == [("de", "messages")]
+
+
+def test_invalid_placeholders(tmp_path, caplog):
+    catalog = Catalog(locale="de")
+    catalog.add("Hello %(name)s!", "Hallo %(nmae)s!")
+    catalog.add("Bye %(name)s!", "Tschüss %(name)s!")
+    catalog.add(("%(num)d Apple", "%(num)d Apples"), ("%(num)d Apfel", "%(num)d Äpfel"))
+    catalog.add(("Apple", "Apples"), ("Ein Apfel", "%(num)d Äpfel"))
+    catalog.add(("One file", "%(count)d files"), ("Eine Datei", "%(count)d Dateien"))
+    catalog.add("greeting.hello", "Hallo %(name)s")
+    path = tmp_path / "de" / "LC_MESSAGES"
+    path.mkdir(parents=True)
+    with open(path / "messages.mo", "wb") as f:
+        write_mo(f, catalog)
+
+    app = flask.Flask(__name__)
+    app.config["BABEL_TRANSLATION_DIRECTORIES"] = str(tmp_path)
+    babel.Babel(app, default_locale="de")
+
+    with app.test_request_context():
+        # Invalid translations are only reported, never dropped.
+        assert babel.get_translations().ugettext("Hello %(name)s!") == "Hallo %(nmae)s!"
+        assert gettext("Bye %(name)s!", name="Peter") == "Tschüss Peter!"
+        assert ngettext("%(num)d Apple", "%(num)d Apples", 2) == "2 Äpfel"
+        assert ngettext("Apple", "Apples", 1) == "Ein Apfel"
+        assert ngettext("Apple", "Apples", 3) == "3 Äpfel"
+        assert ngettext("One file", "%(count)d files", 3, count=3) == "3 Dateien"
+        assert gettext("greeting.hello", name="Peter") == "Hallo Peter"
+
+    assert "unknown placeholders nmae" in caplog.text
+    assert len(caplog.records) == 1
+
+
+def test_overlay_domain():
+    app = flask.Flask(__name__)
+    b = babel.Babel(app, locale_selector=lambda: the_locale)
+    overrides = {
+        "de": {
+            "Yes": "Jawohl",
+            ("%(num)s Apple", 1): "%(num)s Birnen",
+        },
+    }
+
+    the_locale = "de_DE"
+    with app.test_request_context():
+        domain = babel.OverlayDomain(b.domain_instance, overrides)
+        assert domain.gettext("Yes") == "Jawohl"
+        assert domain.ngettext("%(num)s Apple", "%(num)s Apples", 1) == "1 Apfel"
+        assert domain.ngettext("%(num)s Apple", "%(num)s Apples", 2) == "2 Birnen"
+        assert domain.gettext("Hello %(name)s!", name="Peter") == "Hallo Peter!"
+        assert babel.gettext("Yes") == "Ja"
+
+        base = b.domain_instance.get_translations()
+        assert domain.get_translations()._catalog.maps[1] is base._catalog
+
+    the_locale = "ja"
+    with app.test_request_context():
+        assert domain.gettext("Yes") == "はい"
+
+    with app.app_context():
+        b.preload_translations([domain])
+        assert domain.cache["de", "messages"].ugettext("Yes") == "Jawohl"
+        assert domain.load_translations("de_DE").ugettext("Yes") == "Jawohl"
+
+
+def test_overlay_domain_follows_base(tmp_path):
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de")
+    store = babel.DirectoryCatalogStore(
+        str(tmp_path / "store"), cache_dir=str(tmp_path / "cache"), poll_interval=0
+    )
+    store.activate(
+        store.publish(os.path.join(os.path.dirname(__file__), "translations"))
+    )
+    domain = babel.OverlayDomain(babel.Domain(source=store), {"de": {"No": "Nein!"}})
+
+    with app.test_request_context():
+        assert domain.gettext("Yes") == "Ja"
+
+    catalog = Catalog(locale="de")
+    catalog.add("Yes", "Jawohl")
+    directory = tmp_path / "translations" / "de" / "LC_MESSAGES"
+    directory.mkdir(parents=True)
+    with open(directory / "messages.mo", "wb") as f:
+        write_mo(f, catalog)
+    store.activate(store.publish(str(tmp_path / "translations")))
+
+    with app.test_request_context():
+        assert domain.gettext("Yes") == "Jawohl"
+        assert domain.gettext("No") == "Nein!"
+
+
+def test_sqlite_catalog_source(tmp_path):
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+    source = babel.SQLiteCatalogSource(
+        str(tmp_path / "catalogs.sqlite"), revalidate_interval=0
+    )
+    source.save(
+        "de",
+        "messages",
+        {
+            "Yes": "Ja",
+            ("%(num)s Apple", 0): "%(num)s Apfel",
+            ("%(num)s Apple", 1): "%(num)s Äpfel",
+            "button\x04Open": "Öffnen",
+        },
+        plural="(n != 1)",
+    )
+    domain = babel.Domain(source=source)
+
+    with app.test_request_context():
+        assert domain.gettext("Yes") == "Ja"
+        assert domain.ngettext("%(num)s Apple", "%(num)s Apples", 2) == "2 Äpfel"
+        assert domain.pgettext("button", "Open") == "Öffnen"
+        translations = domain.get_translations()
+        assert domain.get_translations() is translations
+
+    source.save("de", "messages", {"Yes": "Jawohl"})
+    with app.test_request_context():
+        assert domain.gettext("Yes") == "Jawohl"
+
+    # Preloading in processes still loads the catalogs from the source.
+    with app.app_context():
+        babel.get_babel().instance.preload_translations([domain], use_processes=True)
+        assert domain.cache["de", "messages"].ugettext("Yes") == "Jawohl"
+
+
+def test_directory_catalog_store(tmp_path, mocker):
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+    store = babel.DirectoryCatalogStore(
+        str(tmp_path / "store"), cache_dir=str(tmp_path / "cache"), poll_interval=0
+    )
+    domain = babel.Domain(source=store)
+    first = store.publish(os.path.join(os.path.dirname(__file__), "translations"))
+    assert (
+        store.publish(os.path.join(os.path.dirname(__file__), "translations")) == first
+    )
+    store.activate(first)
+
+    with app.test_request_context():
+        assert domain.gettext("Yes") == "Ja"
+
+    catalog = Catalog(locale="de")
+    catalog.add("Yes", "Jawohl")
+    directory = tmp_path / "translations" / "de" / "LC_MESSAGES"
+    directory.mkdir(parents=True)
+    with open(directory / "messages.mo", "wb") as f:
+        write_mo(f, catalog)
+    second = store.publish(str(tmp_path / "translations"))
+    assert second != first
+
+    with app.test_request_context():
+        assert domain.gettext("Yes") == "Ja"
+        store.activate(second)
+        # The version stays the same for the rest of the request.
+        assert domain.gettext("Yes") == "Ja"
+
+    with app.test_request_context():
+        assert domain.gettext("Yes") == "Jawohl"
+    assert sorted(os.listdir(tmp_path / "cache")) == sorted([first, second])
+
+    # Other users and nodes can read the store.
+    umask = os.umask(0)
+    os.umask(umask)
+    assert stat.S_IMODE(os.stat(tmp_path / "store" / "CURRENT").st_mode) == (
+        0o666 & ~umask
+    )
+    assert stat.S_IMODE(os.stat(tmp_path / "store" / "versions" / second).st_mode) == (
+        0o777 & ~umask
+    )
+
+    # A version with an identical catalog is only loaded once.
+    (tmp_path / "translations" / "README.mo").write_bytes(b"")
+    third = store.publish(str(tmp_path / "translations"))
+    store.activate(third)
+    load_spy = mocker.spy(store, "load")
+    for i in range(3):
+        with app.test_request_context():
+            assert domain.gettext("Yes") == "Jawohl"
+    assert load_spy.call_count == 1
@@ -0,0 +1,57 @@
+import platform
+import subprocess
+import sys
+
+import pytest
+
+#: The budget for importing Flask-Babel on top of Flask, in milliseconds.
+#: It is generous so slow CI machines pass, and catches regressions like
+#: importing the formatters eagerly again.  The measured time is recorded
+#: as the ``import_ms`` property of the test to track it.
+IMPORT_BUDGET_MS = 500
+
+#: Modules only imported once dates are formatted or catalogs are loaded.
+DEFERRED = [
+    "babel.dates",
+    "babel.numbers",
+    "babel.support",
+    "babel.messages",
+    "pytz",
+    "concurrent.futures.process",
+]
+
+SCRIPT = """
+import sys
+import flask, jinja2.ext, werkzeug.datastructures
+import flask_babel
+app = flask.Flask(__name__)
+flask_babel.Babel(app)
+print(",".join(sorted(sys.modules)))
+"""
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != "CPython",
+    reason="-X importtime is specific to CPython",
+)
+def test_import_time(record_property):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    modules = set(result.stdout.strip().split(","))
+    assert "flask_babel" in modules
+    assert not [name for name in DEFERRED if name in modules]
+
+    # Lines look like "import time:   self [us] |  cumulative | flask_babel".
+    elapsed = None
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if fields[-1].strip() == "flask_babel":
+            elapsed = int(fields[1]) / 1000
+    assert elapsed is not None, result.stderr
+    record_property("import_ms", elapsed)
+    assert elapsed < IMPORT_BUDGET_MS
@@ -1,6 +1,12 @@
+import dataclasses
+import gzip
+import json
 import pickle
+from datetime import date, datetime
+from threading import Thread
 
 import flask
+import pytest
 from babel.support import NullTranslations
 
 import flask_babel as babel
@@ -162,3 +168,273 @@ def test_lazy_pickling():
     unpickled = pickle.loads(pickled)
 
     assert unpickled == lazy_string
+
+
+def test_translator():
+    app = flask.Flask(__name__)
+    b = babel.Babel(app)
+
+    with app.app_context():
+        translator = b.translator("de_DE", "Europe/Vienna")
+        ja = b.translator("ja", domain=babel.Domain(domain="test"))
+
+    def work():
+        results.append(translator.gettext("Hello %(name)s!", name="Peter"))
+        results.append(translator.ngettext("%(num)s Apple", "%(num)s Apples", 2))
+        results.append(translator.format_datetime(datetime(2010, 4, 12, 13, 46)))
+        results.append(translator.format_currency(1099, "USD"))
+        results.append(ja.pgettext("context", "first"))
+        results.append(ja.format_date(date(2010, 4, 12)))
+
+    results = []
+    thread = Thread(target=work)
+    thread.start()
+    thread.join()
+
+    assert results == [
+        "Hallo Peter!",
+        "2 Äpfel",
+        "12.04.2010, 15:46:00",
+        "1.099,00\xa0$",
+        "first",
+        "2010/04/12",
+    ]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        translator.locale = "en"
+
+
+def test_name_tables():
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de")
+
+    with app.test_request_context():
+        zones = babel.get_timezone_names()
+        assert zones is babel.get_timezone_names("de")
+        assert ("Europe/Vienna", "Österreich (Ortszeit)") in zones
+        assert [name for _, name in zones] == babel.sorted_localized(
+            name for _, name in zones
+        )
+
+        territories = dict(babel.get_territory_names())
+        assert territories["AT"] == "Österreich"
+        assert "001" not in territories
+
+        assert dict(babel.get_language_names("en"))["de"] == "German"
+        assert (
+            flask.render_template_string(
+                "{{ dict(language_names())['fr'] }} {{ territory_names()[0][0] }}"
+            )
+            == "Französisch AF"
+        )
+
+
+def test_sorted_localized():
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="de_DE")
+    strings = ["b", "Ä", "a", "Yes", "á", "A"]
+
+    with app.test_request_context():
+        assert babel.sorted_localized(strings) == ["a", "A", "á", "Ä", "b", "Yes"]
+        assert babel.sorted_localized([lazy_gettext("Yes"), "Jo"]) == ["Ja", "Jo"]
+        assert babel.sorted_localized(
+            enumerate(strings), key=lambda item: item[1], reverse=True
+        )[0] == (3, "Yes")
+        assert babel.sort_key("Ä") < babel.sort_key("b")
+
+
+def test_fragment_cache():
+    app = flask.Flask(__name__)
+    app.jinja_env.add_extension("flask_babel.FragmentCacheExtension")
+    babel.Babel(app, locale_selector=lambda: flask.request.args["lang"])
+    calls = []
+
+    def render(lang):
+        with app.test_request_context(query_string={"lang": lang}):
+            return flask.render_template_string(
+                '{% cache "yes", 60 %}{{ _("Yes") }}{{ count() }}{% endcache %}',
+                count=lambda: calls.append(1) or len(calls),
+            )
+
+    assert render("de") == "Ja1"
+    assert render("de") == "Ja1"
+    assert render("en") == "Yes2"
+    assert render("de") == "Ja1"
+
+
+def test_cached_view():
+    app = flask.Flask(__name__)
+    babel.Babel(app, locale_selector=lambda: flask.request.args.get("lang"))
+    calls = []
+
+    @app.route("/")
+    @babel.cached_view()
+    def index():
+        calls.append(1)
+        return gettext("Yes")
+
+    client = app.test_client()
+    response = client.get("/?lang=de")
+    assert response.data == b"Ja"
+    assert response.headers["Vary"] == "Accept-Language"
+    etag = response.headers["ETag"]
+
+    response = client.get("/?lang=de")
+    assert response.data == b"Ja"
+    assert response.headers["ETag"] == etag
+    assert len(calls) == 1
+
+    response = client.get("/?lang=de", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    assert client.get("/").data == b"Yes"
+    assert len(calls) == 2
+
+
+def test_cache_keys_per_domain():
+    app = flask.Flask(__name__)
+    app.jinja_env.add_extension("flask_babel.FragmentCacheExtension")
+    b = babel.Babel(app, default_locale="de")
+    with app.app_context():
+        base = b.domain_instance
+    domains = {
+        "first": babel.OverlayDomain(base, {"de": {"Yes": "Ja, erstens"}}),
+        "second": babel.OverlayDomain(base, {"de": {"Yes": "Ja, zweitens"}}),
+        "plain": babel.Domain(domain="messages"),
+    }
+
+    @app.route("/<name>")
+    @babel.cached_view()
+    def index(name):
+        return flask.render_template_string(
+            '{% cache "yes" %}{{ _("Yes") }}{% endcache %}:{{ _("Yes") }}'
+        )
+
+    @app.url_value_preprocessor
+    def select_domain(endpoint, values):
+        domains[values["name"]].as_default()
+
+    client = app.test_client()
+    for _ in range(2):
+        assert client.get("/first").data == "Ja, erstens:Ja, erstens".encode()
+        assert client.get("/second").data == "Ja, zweitens:Ja, zweitens".encode()
+        assert client.get("/plain").data == b"Ja:Ja"
+
+    app = flask.Flask(__name__)
+    babel.Babel(app)
+    app.register_blueprint(
+        babel.create_catalog_blueprint([babel.Domain(), babel.Domain(domain="test")]),
+        url_prefix="/i18n",
+    )
+    client = app.test_client()
+
+    response = client.get("/i18n/de/messages.json")
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.json["plural"] == "(n != 1)"
+    assert response.json["messages"]["Yes"] == "Ja"
+    assert response.json["plurals"]["%(num)s Apple"] == [
+        "%(num)s Apfel",
+        "%(num)s Äpfel",
+    ]
+    assert client.get("/i18n/de/test.json").json["messages"] == {"first": "erste"}
+
+    etag = response.headers["ETag"]
+    response = client.get("/i18n/de/messages.json", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = client.get("/i18n/de/messages.json", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] != etag
+    assert json.loads(gzip.decompress(response.data))["messages"]["Yes"] == "Ja"
+
+    assert client.get("/i18n/de/other.json").status_code == 404
+    assert client.get("/i18n/xx_invalid/messages.json").status_code == 404
+
+
+def test_context_snapshot(mocker):
+    app = flask.Flask(__name__)
+    locale_selector = mocker.Mock(return_value="de_DE")
+    babel.Babel(
+        app,
+        locale_selector=locale_selector,
+        timezone_selector=lambda: "Europe/Vienna",
+    )
+    domain = babel.Domain(domain="test")
+
+    with app.test_request_context():
+        domain.as_default()
+        snapshot = babel.capture_context()
+        translations = get_translations()
+    assert snapshot == babel.ContextSnapshot("de_DE", "Europe/Vienna", "test")
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+
+    results = []
+
+    def task(snapshot):
+        with app.app_context(), babel.restore_context(snapshot):
+            results.append(
+                (
+                    gettext("first"),
+                    babel.get_timezone().zone,
+                    get_translations() is translations,
+                )
+            )
+
+    thread = Thread(target=task, args=(snapshot,))
+    thread.start()
+    thread.join()
+    # Snapshots passed as dictionaries, or created by hand.
+    task(babel.ContextSnapshot(**dataclasses.asdict(snapshot)))
+    task(babel.ContextSnapshot("de_DE", "UTC", "messages"))
+
+    assert results == [
+        ("erste", "Europe/Vienna", True),
+        ("erste", "Europe/Vienna", True),
+        ("first", "UTC", False),
+    ]
+    assert locale_selector.call_count == 1
+
+    with app.app_context():
+        with babel.restore_context(snapshot):
+            assert str(babel.get_locale()) == "de_DE"
+        assert babel.get_domain() is app.extensions["babel"].domain_instance
+
+
+def test_context_snapshot_domains():
+    app = flask.Flask(__name__)
+    babel.Babel(app, locale_selector=lambda: "de_DE")
+    base = app.extensions["babel"].domain_instance
+    tenant_a = babel.OverlayDomain(base, {"de": {"Yes": "Jawohl"}})
+    tenant_b = babel.OverlayDomain(base, {"de": {"Yes": "Jo"}})
+    composite = babel.CompositeDomain([babel.Domain(domain="test"), base])
+
+    snapshots = {}
+    for name, domain in [("a", tenant_a), ("b", tenant_b), ("c", composite)]:
+        with app.test_request_context():
+            domain.as_default()
+            snapshots[name] = babel.capture_context()
+    assert snapshots["a"] == snapshots["b"]
+
+    with app.app_context():
+        with babel.restore_context(snapshots["a"]):
+            assert gettext("Yes") == "Jawohl"
+        with babel.restore_context(snapshots["b"]):
+            assert gettext("Yes") == "Jo"
+
+        # Snapshots of domains which can not be created again from their
+        # name need the domain when restored in another process.
+        elsewhere = dataclasses.replace(snapshots["c"], token="elsewhere")
+        with pytest.raises(RuntimeError):
+            with babel.restore_context(elsewhere):
+                pass
+        with babel.restore_context(elsewhere, domain=composite):
+            assert gettext("Yes") == "Ja"
+            assert gettext("first") == "erste"
+
+    # Every domain is registered once, however many snapshots are captured.
+    registered = len(babel._captured_domains)
+    with app.test_request_context():
+        tenant_a.as_default()
+        tokens = {babel.capture_context().token for _ in range(1000)}
+    assert tokens == {snapshots["a"].token}
+    assert len(babel._captured_domains) == registered
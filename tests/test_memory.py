@@ -0,0 +1,112 @@
+import gc
+import os
+import platform
+import tracemalloc
+
+import flask
+import pytest
+from babel.messages.catalog import Catalog
+from babel.messages.mofile import write_mo
+
+import flask_babel as babel
+
+#: Budgets for the memory used by every loaded catalog of `MESSAGES`
+#: messages, and by every lazy string, in bytes.
+CATALOG_BUDGET = 400 * 1024
+LAZY_STRING_BUDGET = 512
+
+# tracemalloc and the budgets assume the memory allocator of CPython.
+pytestmark = pytest.mark.skipif(
+    platform.python_implementation() != "CPython",
+    reason="memory budgets are measured for CPython",
+)
+
+LOCALES = ["de", "fr", "it", "es", "nl", "pl", "pt", "sv", "fi", "da"]
+MESSAGES = 1000
+
+
+def _rss():
+    """Returns the resident memory of the process in bytes, if the platform
+    provides it.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _measure(func):
+    """Returns the memory kept alive by the result of `func`, as attributed
+    by tracemalloc and as grown resident memory.  `func` is called once for
+    each, as tracing inflates the resident memory.
+    """
+    gc.collect()
+    rss = _rss()
+    result = func()
+    if rss is not None:
+        rss = _rss() - rss
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        gc.collect()
+        traced = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return result, traced, rss
+
+
+def _write_catalogs(directory):
+    for locale in LOCALES:
+        catalog = Catalog(locale=locale, fuzzy=False)
+        for i in range(MESSAGES):
+            catalog.add(
+                "Message number %(num)s of the application {}".format(i),
+                "{} %(num)s {}".format(locale, i),
+            )
+        path = directory / locale / "LC_MESSAGES"
+        path.mkdir(parents=True)
+        with open(path / "messages.mo", "wb") as f:
+            write_mo(f, catalog)
+
+
+def test_catalog_memory_budget(tmp_path):
+    _write_catalogs(tmp_path)
+
+    def load():
+        app = flask.Flask(__name__)
+        babel.Babel(app, default_translation_directories=str(tmp_path))
+        with app.test_request_context():
+            for locale in LOCALES:
+                with babel.force_locale(locale):
+                    assert babel.gettext(
+                        "Message number %(num)s of the application 7", num=1
+                    ) == "{} 1 7".format(locale)
+            return dict(babel.get_babel().domain_instance.cache)
+
+    catalogs, traced, rss = _measure(load)
+    assert len(catalogs) == len(LOCALES)
+    assert traced / len(LOCALES) < CATALOG_BUDGET, traced
+    if rss is not None:
+        # Resident memory also grows with allocator slack and the code
+        # imported on the way, so only guard against gross regressions.
+        assert rss / len(LOCALES) < 4 * CATALOG_BUDGET, rss
+
+
+def test_lazy_string_memory_budget():
+    count = 50000
+
+    def create():
+        return [
+            babel.lazy_gettext("Hello %(name)s!", name="Peter") for i in range(count)
+        ]
+
+    strings, traced, rss = _measure(create)
+    assert len(strings) == count
+    assert traced / count < LAZY_STRING_BUDGET, traced
+    if rss is not None:
+        assert rss / count < 4 * LAZY_STRING_BUDGET, rss
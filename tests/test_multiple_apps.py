@@ -1,4 +1,7 @@
 import flask
+from babel.messages.catalog import Catalog
+from babel.messages.mofile import write_mo
+
 import flask_babel as babel
 
 
@@ -18,3 +21,81 @@ def test_multiple_apps():
     with app2.test_request_context():
         assert str(babel.get_locale()) == "en_US"
         assert babel.gettext("Hello %(name)s!", name="Peter") == "Hello Peter!"
+
+
+def test_multiple_apps_with_different_directories():
+    b = babel.Babel()
+    domain = babel.Domain()
+
+    app1 = flask.Flask(__name__)
+    b.init_app(app1, default_locale="de_DE")
+
+    app2 = flask.Flask(__name__)
+    app2.config.update(
+        BABEL_TRANSLATION_DIRECTORIES="translations_different_domain",
+        BABEL_DOMAIN="myapp",
+    )
+    b.init_app(app2, default_locale="de_DE")
+
+    app3 = flask.Flask(__name__)
+    app3.config["BABEL_TRANSLATION_DIRECTORIES"] = "renamed_translations"
+    b.init_app(app3, default_locale="de_DE")
+
+    with app1.test_request_context():
+        assert babel.gettext("Good bye") == "Good bye"
+        assert domain.gettext("Yes") == "Ja"
+        first = domain.get_translations()
+
+    with app2.test_request_context():
+        assert babel.gettext("Good bye") == "Auf Wiedersehen"
+        assert domain.gettext("Yes") == "Yes"
+
+    with app3.test_request_context():
+        # The catalog has the same content, so it is shared with app1.
+        assert domain.get_translations() is first
+
+    # Resetting the cache only affects the current directories.
+    with app1.app_context():
+        domain.cache = {}
+        assert domain.cache == {}
+    with app3.app_context():
+        assert domain.cache
+
+
+def test_cache_outside_app_context():
+    domain = babel.Domain()
+    assert domain.cache == {}
+    domain.cache = {"key": "value"}
+    assert domain.cache == {"key": "value"}
+
+
+def _write_catalog(path, translation):
+    catalog = Catalog(locale="de")
+    catalog.add("Yes", translation)
+    with open(path, "wb") as f:
+        write_mo(f, catalog)
+
+
+def test_shared_catalogs_hash_parsed_content(tmp_path):
+    path = tmp_path / "de" / "LC_MESSAGES" / "messages.mo"
+    path.parent.mkdir(parents=True)
+    _write_catalog(path, "Ja")
+
+    def load():
+        app = flask.Flask(__name__)
+        babel.Babel(
+            app, default_locale="de", default_translation_directories=str(tmp_path)
+        )
+        with app.test_request_context():
+            return babel.get_translations()
+
+    first = load()
+    digest = babel._catalog_digest(first)
+
+    # The hash is the one of the content which was parsed, not of whatever
+    # replaced the file since.
+    _write_catalog(path, "Jawohl")
+    assert babel._catalog_digest(first) == digest
+    second = load()
+    assert second is not first
+    assert second.ugettext("Yes") == "Jawohl"
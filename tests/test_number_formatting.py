@@ -1,6 +1,8 @@
+import random
 from decimal import Decimal
 
 import flask
+from babel import Locale, localedata, numbers
 
 import flask_babel as babel
 
@@ -16,3 +18,60 @@ def test_basics():
         assert babel.format_currency(n, "USD") == "$1,099.00"
         assert babel.format_percent(0.19) == "19%"
         assert babel.format_scientific(10000) == "1E4"
+
+
+def test_format_cache():
+    app = flask.Flask(__name__)
+    b = babel.Babel(app, locale_selector=lambda: the_locale, format_cache_size=2)
+
+    the_locale = "en_US"
+    with app.test_request_context():
+        assert babel.format_currency(1099, "USD") == "$1,099.00"
+        assert babel.format_currency(1099, "USD") == "$1,099.00"
+        assert babel.format_percent(0.19) == "19%"
+        assert b.format_cache_info() == (1, 2, 2, 2)
+
+    the_locale = "de_DE"
+    with app.test_request_context():
+        assert babel.format_currency(1099, "USD") == "1.099,00\xa0$"
+        assert b.format_cache_info().currsize == 2
+
+        b.clear_format_cache()
+        assert b.format_cache_info() == (0, 0, 2, 0)
+
+        assert babel.format_decimal(0.0) == "0"
+        assert babel.format_decimal(-0.0) == "-0"
+        assert babel.format_decimal(Decimal("-0")) == "-0"
+        assert babel.format_decimal(Decimal("0")) == "0"
+
+
+def test_preload_locale_data(mocker):
+    load_spy = mocker.spy(babel.localedata, "load")
+
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="fr_FR", preload_locale_data=True)
+
+    assert {call.args[0] for call in load_spy.call_args_list} >= {
+        "de",
+        "ja",
+        "fr_FR",
+    }
+
+
+def test_integer_fast_path():
+    rng = random.Random(1099)
+    values = [0, 1, -1, 999, 1000, -1000, 10**24 - 1, -(10**24) + 1]
+    values += [rng.randint(-(10**digits), 10**digits) for digits in range(1, 24)]
+
+    for identifier in localedata.locale_identifiers():
+        locale = Locale.parse(identifier)
+        for n in rng.sample(values, 10):
+            expected = numbers.format_decimal(n, locale=locale)
+            assert babel._format_decimal(n, None, locale) == expected
+
+    app = flask.Flask(__name__)
+    babel.Babel(app, default_locale="hi_IN")
+    with app.test_request_context():
+        assert babel.format_number(-123456789) == "-12,34,56,789"
+        assert babel.format_decimal(123456789) == "12,34,56,789"
+        assert babel.format_decimal(1234, "#") == "1234"